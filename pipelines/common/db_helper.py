@@ -1,9 +1,107 @@
 """Database helper module for loading and inserting data using NocoDB API."""
 
-from typing import Dict, List, Optional, Any
+import atexit
+import hashlib
+import threading
+import time
+from collections import deque
+from concurrent.futures import Future, ThreadPoolExecutor
+from itertools import chain, islice
+from pathlib import Path
+from typing import (
+    Any,
+    Callable,
+    Deque,
+    Dict,
+    Iterable,
+    Iterator,
+    List,
+    Optional,
+    Tuple,
+    TypeVar,
+)
+import orjson
 import polars as pl
 import httpx
 
+T = TypeVar("T")
+R = TypeVar("R")
+
+# Schemas fetched by this process, shared by every DatabaseHelper on the same base
+# (pipelines create a helper per task): {cache key: (fetch time, table_ids, link_field_ids)}
+_SCHEMA_CACHE: Dict[str, Tuple[float, Dict[str, str], Dict[str, Dict[str, str]]]] = {}
+
+# Helpers returned by DatabaseHelper.shared(), by connection and constructor options:
+# {(base_url, base_id, api_token, sorted kwargs): helper}
+_SHARED_HELPERS: Dict[Tuple[Any, ...], "DatabaseHelper"] = {}
+# Tasks run in worker threads, so a helper must not be created twice for one key
+_SHARED_HELPERS_LOCK = threading.Lock()
+
+
+class RetryClient(httpx.Client):
+    """httpx client that retries requests failing transiently.
+
+    Connection failures, rate-limited (429) and unavailable (503) responses are retried
+    for every method, as the server did not process the request. Other gateway/server
+    errors are only retried for read-only methods: a write (even a delete) may have been
+    applied before the gateway failed, and repeating it would then fail or duplicate it.
+    The delay follows the Retry-After header when present, else exponential backoff.
+    """
+
+    RETRY_STATUS_CODES = {429, 503}
+    SAFE_RETRY_STATUS_CODES = {500, 502, 504}
+    SAFE_METHODS = {"GET", "HEAD", "OPTIONS"}
+
+    def __init__(
+        self,
+        *args: Any,
+        max_attempts: int = 5,
+        max_backoff: float = 30.0,
+        **kwargs: Any,
+    ):
+        super().__init__(*args, **kwargs)
+        self.max_attempts = max_attempts
+        self.max_backoff = max_backoff
+
+    def send(self, request: httpx.Request, **kwargs: Any) -> httpx.Response:
+        attempt = 1
+        while True:
+            try:
+                response = super().send(request, **kwargs)
+            except (httpx.ConnectError, httpx.ConnectTimeout):
+                if attempt >= self.max_attempts:
+                    raise
+                delay = self._backoff(attempt)
+            else:
+                if attempt >= self.max_attempts or not self._should_retry(request, response):
+                    return response
+                delay = self._retry_delay(response, attempt)
+                response.close()
+            time.sleep(delay)
+            attempt += 1
+
+    def _should_retry(self, request: httpx.Request, response: httpx.Response) -> bool:
+        if response.status_code in self.RETRY_STATUS_CODES:
+            return True
+        return (
+            response.status_code in self.SAFE_RETRY_STATUS_CODES
+            and request.method in self.SAFE_METHODS
+        )
+
+    def _backoff(self, attempt: int) -> float:
+        return min(2.0 ** (attempt - 1), self.max_backoff)
+
+    def _retry_delay(self, response: httpx.Response, attempt: int) -> float:
+        retry_after = response.headers.get("Retry-After")
+        if not retry_after:
+            return self._backoff(attempt)
+        try:
+            delay = float(retry_after)
+        except ValueError:
+            # Retry-After may also be an HTTP date, fall back to backoff
+            return self._backoff(attempt)
+        return min(max(delay, 0.0), self.max_backoff)
+
 
 class DatabaseHelper:
     """Helper class for NocoDB operations using Polars dataframes.
@@ -12,9 +110,31 @@ class DatabaseHelper:
     allowing for reading and writing data using Polars DataFrames.
 
     Configuration is loaded dynamically from the NocoDB meta API at startup.
+
+    Use it as a context manager (`with DatabaseHelper(...) as db:`) to close its
+    connections when done, or DatabaseHelper.shared() to reuse one helper per process.
     """
 
-    def __init__(self, api_token: str, base_url: str, base_id: str):
+    # NocoDB v3 data API accepts at most 10 records per bulk create/update/delete
+    MAX_BATCH_SIZE = 10
+    # How long a schema cached in schema_cache_dir stays valid, in seconds
+    SCHEMA_CACHE_TTL = 3600
+    # NocoDB v3 data API returns at most 1000 records per page
+    MAX_PAGE_SIZE = 1000
+    # Split batches further so a request body stays below this size (e.g. large geometries)
+    MAX_BATCH_BYTES = 4_000_000
+    # Error bodies are truncated to this size in exception messages
+    MAX_ERROR_BODY_BYTES = 2048
+
+    def __init__(
+        self,
+        api_token: str,
+        base_url: str,
+        base_id: str,
+        max_concurrency: int = 8,
+        schema_cache_dir: Path | None = None,
+        refresh_schema: bool = False,
+    ):
         """
         Initialize the database helper with NocoDB connection.
 
@@ -22,6 +142,11 @@ class DatabaseHelper:
             api_token: NocoDB API token for authentication (xc-token header)
             base_url: NocoDB server URL (e.g. "https://noco.services.dataforgood.fr")
             base_id: NocoDB base (project) ID (e.g. "pqc6cnm5mpnr9ka")
+            max_concurrency: Maximum number of batch requests in flight at once, at least 1
+                (default: 8)
+            schema_cache_dir: Optional directory where the schema fetched from the meta API
+                is cached for SCHEMA_CACHE_TTL seconds, to skip fetching it on later runs
+            refresh_schema: Fetch the schema even if a valid cached copy exists (default: False)
 
         Example:
             db = DatabaseHelper(
@@ -30,19 +155,51 @@ class DatabaseHelper:
                 base_id="pqc6cnm5mpnr9ka",
             )
         """
+        if max_concurrency < 1:
+            raise ValueError(f"max_concurrency must be at least 1, got {max_concurrency}")
         self.base_url = base_url.rstrip("/")
         self.base_id = base_id
+        self.max_concurrency = max_concurrency
 
         # Setup HTTP client
+        # HTTP/2 multiplexes concurrent batches and pages over one connection;
+        # httpx already negotiates gzip-compressed responses by default.
+        # Transient failures (connection errors, 429/5xx) are retried per request by
+        # RetryClient, so a batch run is not lost.
+        # The pool keeps one warm connection per concurrent worker between batches.
         headers = {"Content-Type": "application/json", "xc-token": api_token}
-        self.client = httpx.Client(
-            base_url=self.base_url, headers=headers, timeout=30.0
+        limits = httpx.Limits(
+            max_connections=max_concurrency,
+            max_keepalive_connections=max_concurrency,
+            keepalive_expiry=30.0,
+        )
+        self.client = RetryClient(
+            base_url=self.base_url,
+            headers=headers,
+            # Fail fast on unreachable hosts, RetryClient retries connection errors
+            timeout=httpx.Timeout(30.0, connect=5.0),
+            http2=True,
+            limits=limits,
         )
 
-        # Fetch schema from meta API
+        # Fetch schema from meta API, unless a recent copy is cached in memory or on disk
         self.table_ids: Dict[str, str] = {}
         self.link_field_ids: Dict[str, Dict[str, str]] = {}
-        self._fetch_schema()
+        self._records_endpoints: Dict[str, str] = {}
+        self._link_endpoint_prefixes: Dict[Tuple[str, str], str] = {}
+        # Key in _SHARED_HELPERS when this helper was returned by shared()
+        self._shared_key: Tuple[Any, ...] | None = None
+        self._schema_cache_key = hashlib.sha256(
+            f"{self.base_url}|{base_id}|{api_token}".encode()
+        ).hexdigest()[:16]
+        self._schema_cache_path: Path | None = None
+        if schema_cache_dir is not None:
+            self._schema_cache_path = (
+                Path(schema_cache_dir) / f"nocodb_schema_{self._schema_cache_key}.json"
+            )
+        if refresh_schema or not self._load_cached_schema():
+            self._fetch_schema()
+            self._save_cached_schema()
 
     def _fetch_schema(self) -> None:
         """Fetch table IDs and link field IDs from the NocoDB meta API.
@@ -67,26 +224,202 @@ class DatabaseHelper:
             )
 
         # Build table_ids mapping
-        for table in tables:
-            self.table_ids[table["title"]] = table["id"]
+        self.table_ids = {table["title"]: table["id"] for table in tables}
 
-        # Step 2: fetch each table's schema to extract link field IDs
-        for table_name, table_id in self.table_ids.items():
+        # Step 2: fetch each table's schema to extract link field IDs (concurrently)
+        def fetch_table_schema(table_id: str) -> Dict[str, Any]:
             resp = self.client.get(
                 f"/api/v3/meta/bases/{self.base_id}/tables/{table_id}"
             )
             resp.raise_for_status()
-            schema = resp.json()
+            return resp.json()
 
-            # Extract link fields
-            link_fields: Dict[str, str] = {}
-            for field in schema.get("fields", []):
-                if field.get("type") == "Links":
-                    link_fields[field["title"]] = field["id"]
+        schemas = self._run_concurrently(fetch_table_schema, self.table_ids.values())
 
+        for table_name, schema in zip(self.table_ids, schemas):
+            # Extract link fields
+            link_fields = {
+                field["title"]: field["id"]
+                for field in schema.get("fields", [])
+                if field.get("type") == "Links"
+            }
             if link_fields:
                 self.link_field_ids[table_name] = link_fields
 
+    def _load_cached_schema(self) -> bool:
+        """Load table IDs and link field IDs from the schema cache, if it is still valid.
+
+        The in-process cache is checked first, then the schema_cache_dir file.
+
+        Returns:
+            True if the schema was loaded from the cache
+        """
+        cached = _SCHEMA_CACHE.get(self._schema_cache_key)
+        if cached and time.time() - cached[0] <= self.SCHEMA_CACHE_TTL:
+            _, self.table_ids, self.link_field_ids = cached
+            return True
+
+        path = self._schema_cache_path
+        if path is None or not path.exists():
+            return False
+        fetched_at = path.stat().st_mtime
+        if time.time() - fetched_at > self.SCHEMA_CACHE_TTL:
+            return False
+        try:
+            cached_file = orjson.loads(path.read_bytes())
+            self.table_ids = cached_file["table_ids"]
+            self.link_field_ids = cached_file["link_field_ids"]
+        except (OSError, orjson.JSONDecodeError, KeyError):
+            return False
+        _SCHEMA_CACHE[self._schema_cache_key] = (
+            fetched_at,
+            self.table_ids,
+            self.link_field_ids,
+        )
+        return True
+
+    def _save_cached_schema(self) -> None:
+        """Store table IDs and link field IDs in the schema cache (and file, if configured)."""
+        _SCHEMA_CACHE[self._schema_cache_key] = (
+            time.time(),
+            self.table_ids,
+            self.link_field_ids,
+        )
+        path = self._schema_cache_path
+        if path is None:
+            return
+        path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = path.with_suffix(".tmp")
+        tmp_path.write_bytes(
+            orjson.dumps(
+                {"table_ids": self.table_ids, "link_field_ids": self.link_field_ids}
+            )
+        )
+        tmp_path.replace(path)
+
+    def _run_concurrently(self, func: Callable[[T], R], items: Iterable[T]) -> List[R]:
+        """
+        Call func on each item, with up to max_concurrency calls in flight.
+
+        httpx.Client is thread-safe, so the workers share its connection pool.
+        Items are consumed lazily (at most 2 * max_concurrency are queued at once),
+        so large payload generators are never fully materialized.
+        Results are returned in the same order as items.
+        """
+        iterator = iter(items)
+        head = list(islice(iterator, 2))
+        if len(head) < 2 or self.max_concurrency <= 1:
+            return [func(item) for item in chain(head, iterator)]
+
+        results: List[R] = []
+        pending: Deque[Future[R]] = deque()
+        executor = ThreadPoolExecutor(max_workers=self.max_concurrency)
+        try:
+            for item in chain(head, iterator):
+                if len(pending) >= 2 * self.max_concurrency:
+                    results.append(pending.popleft().result())
+                pending.append(executor.submit(func, item))
+            results.extend(future.result() for future in pending)
+        finally:
+            # On error, don't start the requests that are still queued
+            executor.shutdown(wait=True, cancel_futures=True)
+        return results
+
+    @staticmethod
+    def _iter_json_rows(df: pl.DataFrame, slice_size: int = 1000) -> Iterator[bytes]:
+        """Yield each row of df as a JSON object, encoded by Polars one slice at a time."""
+        row_json = pl.struct(pl.all()).struct.json_encode()
+        for df_slice in df.iter_slices(n_rows=slice_size):
+            for row in df_slice.select(row_json).to_series():
+                yield row.encode()
+
+    def _chunk_payloads(self, items: Iterable[bytes], batch_size: int) -> Iterator[bytes]:
+        """
+        Join JSON-encoded items into array bodies of at most batch_size items and
+        MAX_BATCH_BYTES bytes.
+
+        A single item larger than MAX_BATCH_BYTES is still sent, on its own.
+        """
+        encoded: List[bytes] = []
+        encoded_bytes = 0
+        for item_json in items:
+            if encoded and (
+                len(encoded) >= batch_size
+                or encoded_bytes + len(item_json) > self.MAX_BATCH_BYTES
+            ):
+                yield b"[" + b",".join(encoded) + b"]"
+                encoded, encoded_bytes = [], 0
+            encoded.append(item_json)
+            encoded_bytes += len(item_json)
+        if encoded:
+            yield b"[" + b",".join(encoded) + b"]"
+
+    @staticmethod
+    def _raise_for_status(response: httpx.Response, action: str) -> None:
+        """
+        Raise if the request failed.
+
+        Raises:
+            ValueError: With NocoDB's error payload on a 422 response
+            httpx.HTTPStatusError: On any other error status
+        """
+        if response.status_code == 422:
+            # The raw body is enough for the message: no parsing, and a non-JSON or
+            # very large error body cannot hide the validation error
+            body = response.content[: DatabaseHelper.MAX_ERROR_BODY_BYTES]
+            raise ValueError(f"Failed to {action}: {body.decode('utf-8', 'replace')}")
+        response.raise_for_status()
+
+    def _records_endpoint(self, table_name: str) -> str:
+        """
+        Get the v3 records endpoint of a table, formatted once per table.
+
+        Raises:
+            ValueError: If table name is not recognized
+        """
+        endpoint = self._records_endpoints.get(table_name)
+        if endpoint is None:
+            table_id = self._get_table_id(table_name)
+            endpoint = f"/api/v3/data/{self.base_id}/{table_id}/records"
+            self._records_endpoints[table_name] = endpoint
+        return endpoint
+
+    def _link_endpoint_prefix(self, table_name: str, link_field_name: str) -> str:
+        """
+        Get the v3 links endpoint of a link field, up to the record id.
+
+        Formatted once per (table, link field); the record id is appended per record.
+
+        Raises:
+            ValueError: If table_name has no link fields
+            ValueError: If link_field_name not found for table
+        """
+        key = (table_name, link_field_name)
+        prefix = self._link_endpoint_prefixes.get(key)
+        if prefix is not None:
+            return prefix
+
+        # Validate table exists in link_field_ids
+        table_link_fields = self.link_field_ids.get(table_name)
+        if table_link_fields is None:
+            raise ValueError(
+                f"Table '{table_name}' has no link fields defined. "
+                f"Available tables with links: {list(self.link_field_ids.keys())}"
+            )
+
+        # Validate link field exists for table
+        link_field_id = table_link_fields.get(link_field_name)
+        if link_field_id is None:
+            raise ValueError(
+                f"Link field '{link_field_name}' not found for table '{table_name}'. "
+                f"Available link fields: {list(table_link_fields.keys())}"
+            )
+
+        table_id = self._get_table_id(table_name)
+        prefix = f"/api/v3/data/{self.base_id}/{table_id}/links/{link_field_id}/"
+        self._link_endpoint_prefixes[key] = prefix
+        return prefix
+
     def _get_table_id(self, table_name: str) -> str:
         """
         Get the NocoDB table ID from the friendly table name.
@@ -115,6 +448,7 @@ class DatabaseHelper:
         condition: Optional[Dict[str, Any]] = None,
         limit: int = 1000,
         offset: int = 0,
+        view_id: Optional[str] = None,
     ) -> pl.DataFrame:
         """
         Load one or more fields from a NocoDB table.
@@ -123,9 +457,12 @@ class DatabaseHelper:
             table_name: Name of the table to query (e.g., "Zone", "Actor")
             fields: List of field names to select
             condition: Optional dictionary of key-value pairs for WHERE clause
+                       (a None value matches blank fields)
                       Format: {"field": "value"} creates (field,eq,value) in NocoDB
             limit: Maximum number of records to return (default: 1000, max: 1000)
             offset: Number of records to skip for pagination (default: 0)
+            view_id: Optional NocoDB view to read from; a view saved with the filter
+                     lets the server apply it instead of parsing a where clause
 
         Returns:
             Polars DataFrame with the selected fields
@@ -133,40 +470,96 @@ class DatabaseHelper:
         Raises:
             httpx.HTTPError: If the API request fails
         """
-        table_id = self._get_table_id(table_name)
+        endpoint = self._records_endpoint(table_name)
 
         # Build query parameters
+        page_size = min(limit, self.MAX_PAGE_SIZE)
+        params = self._build_query_params(fields, condition, page_size, view_id)
+
+        # Add page parameter for pagination
+        page = (offset // page_size) + 1
+
+        records, _ = self._get_records_page(endpoint, params, page)
+        return self._records_to_df(records, fields)
+
+    def _build_query_params(
+        self,
+        fields: List[str] | None,
+        condition: Optional[Dict[str, Any]],
+        page_size: int,
+        view_id: Optional[str] = None,
+    ) -> Dict[str, Any]:
+        """Build the query parameters shared by every page of a records listing."""
         params: Dict[str, Any] = {
-            "pageSize": min(limit, 1000),  # NocoDB max limit
+            "pageSize": page_size,
         }
+        if view_id:
+            params["viewId"] = view_id
         if fields:
             params["fields"] = ",".join(fields)
 
-        # Add page parameter for pagination
-        if offset > 0:
-            page = (offset // min(limit, 1000)) + 1
-            params["page"] = page
-
         # Add WHERE condition if provided
-        # NocoDB format: where=(field,eq,value) or where=(field1,eq,value1)~and(field2,eq,value2)
         if condition:
-            where_parts = [f"({k},eq,{v})" for k, v in condition.items()]
-            params["where"] = "~and".join(where_parts)
+            params["where"] = self._build_where(condition)
+        return params
+
+    @staticmethod
+    def _build_where(condition: Dict[str, Any]) -> str:
+        """
+        Build a NocoDB where clause matching every field of condition.
+
+        NocoDB format: (field,eq,value) or (field1,eq,value1)~and(field2,eq,value2).
+        A None value matches blank fields (null or empty): (field,blank).
+        Values are sent as is: httpx percent-encodes the query string, and NocoDB
+        compares the decoded value, so quoting them here would break the match
+        (e.g. for non-ASCII names).
+        """
+        return "~and".join(
+            [f"({k},blank)" if v is None else f"({k},eq,{v})" for k, v in condition.items()]
+        )
+
+    def _get_records_page(
+        self, endpoint: str, params: Dict[str, Any], page: int
+    ) -> Tuple[List[Dict[str, Any]], bool]:
+        """
+        Fetch one page of v3 records, flattened as {Id: 123, field: value, ...}.
+
+        Records are flattened as soon as the page is parsed so that the response body
+        and the nested v3 records can be released; when pages are fetched concurrently
+        this also overlaps the parsing of one page with the download of the others.
+
+        Returns:
+            The page records and whether more pages follow. NocoDB's "next" link is
+            used when present, otherwise a full page is assumed to have a successor.
+        """
+        if page > 1:
+            params = {**params, "page": page}
 
         # Make API call using v3 endpoint
-        endpoint = f"/api/v3/data/{self.base_id}/{table_id}/records"
         response = self.client.get(endpoint, params=params)
         if response.status_code == 422:
-            err_payload = response.json()
-            # in case we have exactly N * Limit records
-            if err_payload["error"] != "ERR_INVALID_OFFSET_VALUE":
-                raise ValueError(f"Failed to load fields: {response.json()}")
-        else:
-            response.raise_for_status()
+            err_payload = orjson.loads(response.content)
+            # in case we have exactly N * Limit records: the page is past the end
+            if err_payload.get("error") == "ERR_INVALID_OFFSET_VALUE":
+                return [], False
+            raise ValueError(f"Failed to load fields: {err_payload}")
+        response.raise_for_status()
 
-        data = response.json()
-        records = data.get("records", [])
+        data = orjson.loads(response.content)
 
+        # Transform v3 format: {id: 123, fields: {...}} -> {Id: 123, ...}
+        records = [
+            {"Id": record.get("id"), **record.get("fields", {})}
+            for record in data.get("records", [])
+        ]
+        if "next" in data:
+            return records, bool(data["next"])
+        return records, len(records) >= params["pageSize"]
+
+    def _records_to_df(
+        self, records: List[Dict[str, Any]], fields: List[str] | None
+    ) -> pl.DataFrame:
+        """Build a DataFrame from flattened records, with one column per requested field."""
         # Convert to Polars DataFrame
         if not records:
             # Return empty DataFrame with correct schema
@@ -174,28 +567,31 @@ class DatabaseHelper:
             schema: Dict[str, Any] = {"Id": pl.Int64}
             if fields:
                 for field in fields:
-                    if field.lower() == "id":
-                        schema[field] = pl.Int64
-                    else:
-                        schema[field] = pl.Utf8
+                    schema[field] = self._empty_field_dtype(field)
             return pl.DataFrame(schema=schema)
 
-        # Transform v3 format: {id: 123, fields: {...}} -> {Id: 123, ...}
-        flattened_records = []
-        for record in records:
-            flat_record = {}
-            # Map "id" to "Id"
-            if "id" in record:
-                flat_record["Id"] = record["id"]
-            # Expand "fields" dict into top-level columns
-            if "fields" in record:
-                flat_record.update(record["fields"])
-            flattened_records.append(flat_record)
-
-        return pl.DataFrame(flattened_records).select(fields)
+        # Scan every record for the schema: a field can be empty in the first rows
+        df = pl.DataFrame(records, infer_schema_length=None)
+        if not fields:
+            return df
+
+        # The server already projected the requested fields, but omits a field that
+        # is empty in every returned record: add those as null columns, then order.
+        missing = [field for field in fields if field not in df.columns]
+        if missing:
+            df = df.with_columns(
+                pl.lit(None, dtype=self._empty_field_dtype(field)).alias(field)
+                for field in missing
+            )
+        return df.select(fields)
+
+    @staticmethod
+    def _empty_field_dtype(field: str) -> Any:
+        """Dtype used for a field with no values: Int64 for the id, Utf8 otherwise."""
+        return pl.Int64 if field.lower() == "id" else pl.Utf8
 
     def insert_records(
-        self, df: pl.DataFrame, table_name: str, batch_size: int = 10
+        self, df: pl.DataFrame, table_name: str, batch_size: int = MAX_BATCH_SIZE
     ) -> pl.DataFrame:
         """
         Load a Polars DataFrame into a NocoDB table (bulk insert).
@@ -203,7 +599,9 @@ class DatabaseHelper:
         Args:
             df: Polars DataFrame to insert
             table_name: Name of the target table (e.g., "Zone", "Actor")
-            batch_size: Number of records to insert per batch (default: 10)
+            batch_size: Number of records to insert per batch (default: 10). The NocoDB v3
+                        API accepts at most MAX_BATCH_SIZE (10) records per request, so
+                        larger values are clamped; batches are sent concurrently instead
 
         Raises:
             httpx.HTTPError: If the API request fails
@@ -212,41 +610,33 @@ class DatabaseHelper:
             Polars DataFrame with the inserted records and their IDs
         """
         if df.is_empty():
-            return df.with_columns(pl.lit(None).alias("Id"))
-
-        table_id = self._get_table_id(table_name)
+            return df.with_columns(pl.Series("Id", [], dtype=pl.Int64))
 
-        # Convert DataFrame to list of dicts
-        records = df.to_dicts()
+        endpoint = self._records_endpoint(table_name)
+        batch_size = min(batch_size, self.MAX_BATCH_SIZE)
 
-        # v3 endpoint
-        endpoint = f"/api/v3/data/{self.base_id}/{table_id}/records"
+        # Transform to v3 format: wrap data in "fields" object, encoded by Polars
+        records = self._iter_json_rows(df.select(pl.struct(pl.all()).alias("fields")))
 
-        # Insert in batches to avoid overwhelming the API
-        for i in range(0, len(records), batch_size):
-            batch = records[i : i + batch_size]
+        def insert_batch(body: bytes) -> List[Any]:
+            response = self.client.post(endpoint, content=body)
+            self._raise_for_status(response, "insert records")
 
-            # Transform to v3 format: wrap data in "fields" object
-            v3_batch = [{"fields": record} for record in batch]
+            # v3 returns {records: [{id: 123, fields: {...}}, ...]}, in insertion order
+            return [record["id"] for record in orjson.loads(response.content)["records"]]
 
-            response = self.client.post(endpoint, json=v3_batch)
-            if response.status_code == 422:
-                raise ValueError(f"Failed to insert records: {response.json()}")
-            response.raise_for_status()
-
-            # v3 returns {records: [{id: 123, fields: {...}}, ...]}
-            response_data = response.json()
-            inserted_records = response_data["records"]
-
-            # Extract Id from each record and add to batch
-            for j, record in enumerate(inserted_records):
-                # Map v3 format "id" to "Id"
-                batch[j]["Id"] = record["id"]
+        # Insert in batches to avoid overwhelming the API, several batches in flight at once
+        inserted_ids = self._run_concurrently(
+            insert_batch, self._chunk_payloads(records, batch_size)
+        )
 
-        return pl.DataFrame(records)
+        # Map v3 format "id" to "Id"
+        return df.with_columns(
+            pl.Series("Id", [i for ids in inserted_ids for i in ids])
+        )
 
     def update_records(
-        self, df: pl.DataFrame, table_name: str, batch_size: int = 10
+        self, df: pl.DataFrame, table_name: str, batch_size: int = MAX_BATCH_SIZE
     ) -> pl.DataFrame:
         """
         Update existing records in a NocoDB table (bulk update).
@@ -254,7 +644,9 @@ class DatabaseHelper:
         Args:
             df: Polars DataFrame with "Id" column and fields to update
             table_name: Name of the target table (e.g., "Zone", "Actor")
-            batch_size: Number of records to update per batch (default: 10)
+            batch_size: Number of records to update per batch (default: 10). The NocoDB v3
+                        API accepts at most MAX_BATCH_SIZE (10) records per request, so
+                        larger values are clamped; batches are sent concurrently instead
 
         Raises:
             ValueError: If "Id" column is missing from dataframe
@@ -272,7 +664,9 @@ class DatabaseHelper:
                 "DataFrame must have 'Id' column containing record IDs to update."
             )
 
-        table_id = self._get_table_id(table_name)
+        endpoint = self._records_endpoint(table_name)
+
+        batch_size = min(batch_size, self.MAX_BATCH_SIZE)
 
         # Filter out rows where Id is null
         records_to_update = df.filter(pl.col("Id").is_not_null())
@@ -280,31 +674,29 @@ class DatabaseHelper:
         if records_to_update.is_empty():
             return df
 
-        # Convert DataFrame to list of dicts
-        records = records_to_update.to_dicts()
+        # Nothing to set on the records
+        if records_to_update.width == 1:
+            return records_to_update
 
-        # v3 endpoint
-        endpoint = f"/api/v3/data/{self.base_id}/{table_id}/records"
+        # Transform to v3 format: {"id": record_id, "fields": {...}}, encoded by Polars
+        records = self._iter_json_rows(
+            records_to_update.select(
+                pl.col("Id").cast(pl.Utf8).alias("id"),
+                pl.struct(pl.exclude("Id")).alias("fields"),
+            )
+        )
 
-        # Update in batches to avoid overwhelming the API
-        for i in range(0, len(records), batch_size):
-            batch = records[i : i + batch_size]
+        def update_batch(body: bytes) -> None:
+            response = self.client.patch(endpoint, content=body)
+            self._raise_for_status(response, "update records")
 
-            # Transform to v3 format: {"id": record_id, "fields": {...}}
-            v3_batch = []
-            for record in batch:
-                record_id = record.pop("Id")  # Extract Id from the record
-                v3_batch.append({"id": str(record_id), "fields": record})
-
-            response = self.client.patch(endpoint, json=v3_batch)
-            if response.status_code == 422:
-                raise ValueError(f"Failed to update records: {response.json()}")
-            response.raise_for_status()
+        # Update in batches to avoid overwhelming the API, several batches in flight at once
+        self._run_concurrently(update_batch, self._chunk_payloads(records, batch_size))
 
         return records_to_update
 
     def delete_records(
-        self, df: pl.DataFrame, table_name: str, batch_size: int = 10
+        self, df: pl.DataFrame, table_name: str, batch_size: int = MAX_BATCH_SIZE
     ) -> None:
         """
         Delete records from a NocoDB table (bulk delete).
@@ -312,7 +704,9 @@ class DatabaseHelper:
         Args:
             df: Polars DataFrame with "Id" column containing record IDs to delete
             table_name: Name of the target table (e.g., "Zone", "Actor")
-            batch_size: Number of records to delete per batch (default: 10)
+            batch_size: Number of records to delete per batch (default: 10). The NocoDB v3
+                        API accepts at most MAX_BATCH_SIZE (10) records per request, so
+                        larger values are clamped; batches are sent concurrently instead
 
         Raises:
             ValueError: If "Id" column is missing from dataframe
@@ -327,7 +721,9 @@ class DatabaseHelper:
                 "DataFrame must have 'Id' column containing record IDs to delete."
             )
 
-        table_id = self._get_table_id(table_name)
+        endpoint = self._records_endpoint(table_name)
+
+        batch_size = min(batch_size, self.MAX_BATCH_SIZE)
 
         # Filter out rows where Id is null
         records_to_delete = df.filter(pl.col("Id").is_not_null())
@@ -335,29 +731,26 @@ class DatabaseHelper:
         if records_to_delete.is_empty():
             return
 
-        # Extract IDs as list
-        ids = records_to_delete["Id"].to_list()
-
-        # v3 endpoint
-        endpoint = f"/api/v3/data/{self.base_id}/{table_id}/records"
-
-        # Delete in batches
-        for i in range(0, len(ids), batch_size):
-            batch_ids = ids[i : i + batch_size]
+        # Format as array of {"id": <value>}, encoded one slice at a time
+        payload_items = self._iter_json_rows(
+            records_to_delete.select(pl.col("Id").cast(pl.Utf8).alias("id"))
+        )
 
-            # Format as array of {"id": <value>}
-            delete_payload = [{"id": str(id_val)} for id_val in batch_ids]
+        def delete_batch(body: bytes) -> None:
+            response = self.client.request("DELETE", endpoint, content=body)
+            self._raise_for_status(response, "delete records")
 
-            response = self.client.request("DELETE", endpoint, json=delete_payload)
-            if response.status_code == 422:
-                raise ValueError(f"Failed to delete records: {response.json()}")
-            response.raise_for_status()
+        # Delete in batches, several batches in flight at once
+        self._run_concurrently(
+            delete_batch, self._chunk_payloads(payload_items, batch_size)
+        )
 
     def load_all_records(
         self,
         table_name: str,
         fields: Optional[List[str]] = None,
         condition: Optional[Dict[str, Any]] = None,
+        view_id: Optional[str] = None,
     ) -> pl.DataFrame:
         """
         Load all records from a table with automatic pagination.
@@ -366,32 +759,39 @@ class DatabaseHelper:
             table_name: Name of the table to query
             fields: Optional list of field names to select (if None, returns all fields)
             condition: Optional dictionary of key-value pairs for WHERE clause
+                       (a None value matches blank fields)
+            view_id: Optional NocoDB view to read from (its filters and sorts apply)
 
         Returns:
             Polars DataFrame with all matching records
         """
-        all_records = []
-        offset = 0
-        limit = 1000
-
-        while True:
-            batch = self.load_fields(
-                table_name=table_name,
-                fields=fields,
-                condition=condition,
-                limit=limit,
-                offset=offset,
-            )
-
-            all_records.append(batch)
-
-            if len(batch) < limit:
-                # Last page
-                break
-
-            offset += limit
-
-        return pl.concat(all_records, how="diagonal")
+        endpoint = self._records_endpoint(table_name)
+        params = self._build_query_params(fields, condition, self.MAX_PAGE_SIZE, view_id)
+
+        def fetch_page(page: int) -> Tuple[List[Dict[str, Any]], bool]:
+            return self._get_records_page(endpoint, params, page)
+
+        all_records, has_more = fetch_page(1)
+        next_page = 2
+        wave_size = 1
+
+        # Fetch the following pages in waves of concurrent requests, until a page
+        # is the last one: NocoDB says so, or it is short or empty. Waves start with
+        # a single page and double up to max_concurrency, so small tables don't
+        # request pages past their end.
+        while has_more:
+            pages = range(next_page, next_page + wave_size)
+            for records, has_more in self._run_concurrently(fetch_page, pages):
+                all_records.extend(records)
+                if len(records) < self.MAX_PAGE_SIZE:
+                    has_more = False
+                if not has_more:
+                    break
+            next_page += wave_size
+            wave_size = min(2 * wave_size, self.max_concurrency)
+
+        # Build a single DataFrame from all pages instead of concatenating per-page frames
+        return self._records_to_df(all_records, fields)
 
     def link_records(
         self,
@@ -427,19 +827,8 @@ class DatabaseHelper:
             actors_df = db.insert_records(actors_df, "Actor")
             db.link_records(actors_df, "Actor", "Zones", "Zone_ids")
         """
-        # Validate table exists in link_field_ids
-        if table_name not in self.link_field_ids:
-            raise ValueError(
-                f"Table '{table_name}' has no link fields defined. "
-                f"Available tables with links: {list(self.link_field_ids.keys())}"
-            )
-
-        # Validate link field exists for table
-        if link_field_name not in self.link_field_ids[table_name]:
-            raise ValueError(
-                f"Link field '{link_field_name}' not found for table '{table_name}'. "
-                f"Available link fields: {list(self.link_field_ids[table_name].keys())}"
-            )
+        # Validate table and link field, the record id is appended for each record
+        endpoint_prefix = self._link_endpoint_prefix(table_name, link_field_name)
 
         # Validate dataframe has required columns
         if "Id" not in df.columns:
@@ -454,38 +843,103 @@ class DatabaseHelper:
                 f"Available columns: {df.columns}"
             )
 
-        # Get table_id and link_field_id
-        table_id = self._get_table_id(table_name)
-        link_field_id = self.link_field_ids[table_name][link_field_name]
-
-        # Filter out rows where foreign key is null
-        records_to_link = df.filter(pl.col(foreign_key_column).is_not_null())
+        # Normalize list columns to one row per foreign key
+        records_to_link = df.select("Id", foreign_key_column)
+        if isinstance(records_to_link.schema[foreign_key_column], pl.List):
+            records_to_link = records_to_link.explode(foreign_key_column)
+
+        # Filter out rows where foreign key is null, and group the foreign keys of
+        # each parent record so that each record is linked with a single request
+        records_to_link = (
+            records_to_link.filter(pl.col(foreign_key_column).is_not_null())
+            .group_by("Id", maintain_order=True)
+            .agg(pl.col(foreign_key_column).unique(maintain_order=True))
+        )
 
         if records_to_link.is_empty():
             return
 
-        # v3 endpoint
-        endpoint_template = f"/api/v3/data/{self.base_id}/{table_id}/links/{link_field_id}/{{record_id}}"
-
-        # Link each record
-        for row in records_to_link.iter_rows(named=True):
-            record_id = row["Id"]
-            foreign_value = row[foreign_key_column]
+        # Encode each link body in Polars: [{"id": "<foreign key>"}, ...]
+        link_id_json = pl.struct(pl.element().cast(pl.Utf8).alias("id")).struct.json_encode()
+        records_to_link = records_to_link.select(
+            pl.col("Id").cast(pl.Utf8),
+            pl.concat_str(
+                pl.lit("["),
+                pl.col(foreign_key_column).list.eval(link_id_json).list.join(","),
+                pl.lit("]"),
+            ),
+        )
 
-            # Handle both single integer and list of integers
-            if isinstance(foreign_value, list):
-                # List of foreign keys - create multiple link records
-                link_payload = [{"id": str(v)} for v in foreign_value]
-            else:
-                # Single foreign key - create single link record
-                link_payload = [{"id": str(foreign_value)}]
+        def link_record(row: Tuple[str, str]) -> None:
+            record_id, link_payload = row
 
             # POST to link endpoint
-            endpoint = endpoint_template.format(record_id=record_id)
-            response = self.client.post(endpoint, json=link_payload)
+            response = self.client.post(
+                endpoint_prefix + record_id, content=link_payload.encode()
+            )
             response.raise_for_status()
 
-    def __del__(self):
-        """Close the HTTP client when the object is destroyed."""
-        if hasattr(self, "client"):
-            self.client.close()
+        # Link each record, several requests in flight at once
+        # (rows are positional tuples: Id, encoded list of foreign keys)
+        self._run_concurrently(link_record, records_to_link.iter_rows())
+
+    @classmethod
+    def shared(
+        cls, api_token: str, base_url: str, base_id: str, **kwargs: Any
+    ) -> "DatabaseHelper":
+        """
+        Get the helper shared by every caller of this process for a NocoDB base.
+
+        The helper is created on first use (extra kwargs are passed to the constructor),
+        then reused so all pipeline stages share one warm keep-alive connection pool.
+        Callers passing different kwargs (e.g. max_concurrency) get different helpers.
+        It is closed when the interpreter exits; closing it earlier (close() or a with
+        block) removes it from the cache, so the next caller gets a new helper.
+
+        Example:
+            db = DatabaseHelper.shared(
+                api_token="your_token_here",
+                base_url="https://noco.services.dataforgood.fr",
+                base_id="pqc6cnm5mpnr9ka",
+            )
+        """
+        key = (base_url.rstrip("/"), base_id, api_token, tuple(sorted(kwargs.items())))
+        with _SHARED_HELPERS_LOCK:
+            helper = _SHARED_HELPERS.get(key)
+        if helper is not None:
+            return helper
+
+        # Built outside the lock: the schema fetch must not block callers of other bases
+        new_helper = cls(
+            api_token=api_token, base_url=base_url, base_id=base_id, **kwargs
+        )
+        with _SHARED_HELPERS_LOCK:
+            helper = _SHARED_HELPERS.setdefault(key, new_helper)
+            if helper is new_helper:
+                new_helper._shared_key = key
+        if helper is new_helper:
+            atexit.register(new_helper.close)
+        else:
+            # Another thread created the helper first, keep a single connection pool
+            new_helper.close()
+        return helper
+
+    def close(self) -> None:
+        """Close the HTTP client and its connection pool.
+
+        A shared helper is also removed from the shared() cache.
+        """
+        with _SHARED_HELPERS_LOCK:
+            if (
+                self._shared_key is not None
+                and _SHARED_HELPERS.get(self._shared_key) is self
+            ):
+                del _SHARED_HELPERS[self._shared_key]
+            self._shared_key = None
+        self.client.close()
+
+    def __enter__(self) -> "DatabaseHelper":
+        return self
+
+    def __exit__(self, *exc_info: Any) -> None:
+        self.close()
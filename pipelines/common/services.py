@@ -1,3 +1,4 @@
+from pathlib import Path
 from pipelines.common.db_helper import DatabaseHelper
 import dotenv
 import os
@@ -6,8 +7,22 @@ import os
 dotenv.load_dotenv()
 
 
+def _positive_int_env(name: str, default: int) -> int:
+    """Read an optional environment variable holding an integer of at least 1."""
+    value = os.getenv(name)
+    if value is None:
+        return default
+    try:
+        number = int(value)
+    except ValueError:
+        raise ValueError(f"{name} must be an integer, got {value!r}") from None
+    if number < 1:
+        raise ValueError(f"{name} must be at least 1, got {number}")
+    return number
+
+
 def db_helper() -> DatabaseHelper:
-    """Create a new DatabaseHelper instance."""
+    """Get the DatabaseHelper shared by all tasks of this process."""
     api_token = os.getenv("NOCODB_API_TOKEN")
     if api_token is None:
         raise ValueError("NOCODB_API_TOKEN is not set")
@@ -20,4 +35,15 @@ def db_helper() -> DatabaseHelper:
     if base_id is None:
         raise ValueError("BASE_ID is not set")
 
-    return DatabaseHelper(api_token=api_token, base_url=base_url, base_id=base_id)
+    # Optional: cache the NocoDB schema on disk between runs
+    schema_cache_dir = os.getenv("NOCODB_SCHEMA_CACHE_DIR")
+    # Optional: number of concurrent requests (batches, links, pages) sent to NocoDB
+    max_concurrency = _positive_int_env("NOCODB_MAX_CONCURRENCY", default=8)
+
+    return DatabaseHelper.shared(
+        api_token=api_token,
+        base_url=base_url,
+        base_id=base_id,
+        max_concurrency=max_concurrency,
+        schema_cache_dir=Path(schema_cache_dir).expanduser() if schema_cache_dir else None,
+    )
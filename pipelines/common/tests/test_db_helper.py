@@ -1,13 +1,29 @@
 """Tests for DatabaseHelper class."""
 
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import httpx
+import orjson
 import pytest
 from unittest.mock import Mock, patch
 import polars as pl
-from pipelines.common.db_helper import DatabaseHelper
+from pipelines.common import db_helper as db_helper_module
+from pipelines.common.db_helper import DatabaseHelper, RetryClient
 
 
 # --- Test fixtures / helpers ---
 
+
+@pytest.fixture(autouse=True)
+def _clear_schema_cache():
+    """Each test starts without schemas or helpers cached by previous tests."""
+    db_helper_module._SCHEMA_CACHE.clear()
+    db_helper_module._SHARED_HELPERS.clear()
+    yield
+    db_helper_module._SCHEMA_CACHE.clear()
+    db_helper_module._SHARED_HELPERS.clear()
+
 # Minimal meta API responses for a two-table database
 TABLES_LIST_RESPONSE = {
     "list": [
@@ -69,7 +85,7 @@ def _mock_meta_get(url, **kwargs):
 
 def _make_db_helper() -> DatabaseHelper:
     """Create a DatabaseHelper with mocked meta API calls."""
-    with patch("httpx.Client") as MockClient:
+    with patch("pipelines.common.db_helper.RetryClient") as MockClient:
         mock_client = Mock()
         MockClient.return_value = mock_client
         mock_client.get = Mock(side_effect=_mock_meta_get)
@@ -122,7 +138,7 @@ class TestDatabaseHelperInitialization:
             db._get_table_id("NonExistent")
 
     def test_client_headers(self):
-        with patch("httpx.Client") as MockClient:
+        with patch("pipelines.common.db_helper.RetryClient") as MockClient:
             mock_client = Mock()
             MockClient.return_value = mock_client
             mock_client.get = Mock(side_effect=_mock_meta_get)
@@ -139,11 +155,15 @@ class TestDatabaseHelperInitialization:
                     "Content-Type": "application/json",
                     "xc-token": "my_secret_token",
                 },
-                timeout=30.0,
+                timeout=httpx.Timeout(30.0, connect=5.0),
+                http2=True,
+                limits=httpx.Limits(
+                    max_connections=8, max_keepalive_connections=8, keepalive_expiry=30.0
+                ),
             )
 
     def test_empty_tables_raises(self):
-        with patch("httpx.Client") as MockClient:
+        with patch("pipelines.common.db_helper.RetryClient") as MockClient:
             mock_client = Mock()
             MockClient.return_value = mock_client
 
@@ -159,12 +179,211 @@ class TestDatabaseHelperInitialization:
                     base_id="bad_base",
                 )
 
+    def test_schema_cache_skips_meta_api(self, tmp_path):
+        with patch("pipelines.common.db_helper.RetryClient") as MockClient:
+            mock_client = Mock()
+            MockClient.return_value = mock_client
+            mock_client.get = Mock(side_effect=_mock_meta_get)
+
+            kwargs = dict(
+                api_token="tok",
+                base_url="https://x.com",
+                base_id="base",
+                schema_cache_dir=tmp_path,
+            )
+            DatabaseHelper(**kwargs)
+            assert mock_client.get.call_count == 3
+
+            # New process: only the file cache is left
+            db_helper_module._SCHEMA_CACHE.clear()
+            mock_client.get.reset_mock()
+            db = DatabaseHelper(**kwargs)
+            mock_client.get.assert_not_called()
+            assert db.table_ids == {"Actor": "tbl_actor", "Zone": "tbl_zone"}
+            assert db.link_field_ids["Actor"]["Zones"] == "lnk_zones"
+
+            DatabaseHelper(**kwargs, refresh_schema=True)
+            assert mock_client.get.call_count == 3
+
+    def test_schema_shared_between_instances(self):
+        with patch("pipelines.common.db_helper.RetryClient") as MockClient:
+            mock_client = Mock()
+            MockClient.return_value = mock_client
+            mock_client.get = Mock(side_effect=_mock_meta_get)
+
+            kwargs = dict(api_token="tok", base_url="https://x.com", base_id="base")
+            DatabaseHelper(**kwargs)
+            db = DatabaseHelper(**kwargs)
+            assert mock_client.get.call_count == 3
+            assert db.table_ids == {"Actor": "tbl_actor", "Zone": "tbl_zone"}
+
+            DatabaseHelper(**{**kwargs, "base_id": "other"})
+            assert mock_client.get.call_count == 6
+
+    @patch("pipelines.common.db_helper.atexit.register")
+    def test_shared_reuses_helper(self, mock_register):
+        with patch("pipelines.common.db_helper.RetryClient") as MockClient:
+            MockClient.return_value.get = Mock(side_effect=_mock_meta_get)
+
+            kwargs = dict(api_token="tok", base_url="https://x.com", base_id="base")
+            db = DatabaseHelper.shared(**kwargs)
+            assert DatabaseHelper.shared(**{**kwargs, "base_url": "https://x.com/"}) is db
+            assert DatabaseHelper.shared(**{**kwargs, "base_id": "other"}) is not db
+            assert DatabaseHelper.shared(**kwargs, max_concurrency=2) is not db
+            assert MockClient.call_count == 3
+            mock_register.assert_any_call(db.close)
+
+    @patch("pipelines.common.db_helper.atexit.register")
+    def test_shared_creates_one_helper_across_threads(self, mock_register):
+        def slow_meta_get(*args, **kwargs):
+            # Widen the window in which concurrent callers could both create a helper
+            time.sleep(0.01)
+            return _mock_meta_get(*args, **kwargs)
+
+        with patch("pipelines.common.db_helper.RetryClient") as MockClient:
+            MockClient.return_value.get = Mock(side_effect=slow_meta_get)
+            kwargs = dict(api_token="tok", base_url="https://x.com", base_id="base")
+
+            with ThreadPoolExecutor(max_workers=8) as executor:
+                helpers = list(
+                    executor.map(lambda _: DatabaseHelper.shared(**kwargs), range(16))
+                )
+
+            assert all(helper is helpers[0] for helper in helpers)
+            assert db_helper_module._SHARED_HELPERS == {helpers[0]._shared_key: helpers[0]}
+            mock_register.assert_called_once_with(helpers[0].close)
+            # Helpers built by threads that lost the race are closed right away
+            assert MockClient.return_value.close.call_count == MockClient.call_count - 1
+
+    @patch("pipelines.common.db_helper.atexit.register")
+    def test_closing_shared_helper_evicts_it(self, mock_register):
+        with patch("pipelines.common.db_helper.RetryClient") as MockClient:
+            MockClient.side_effect = lambda **kwargs: Mock(
+                get=Mock(side_effect=_mock_meta_get)
+            )
+            kwargs = dict(api_token="tok", base_url="https://x.com", base_id="base")
+
+            with DatabaseHelper.shared(**kwargs) as db:
+                assert DatabaseHelper.shared(**kwargs) is db
+
+            db.client.close.assert_called_once()
+            assert db_helper_module._SHARED_HELPERS == {}
+            new_db = DatabaseHelper.shared(**kwargs)
+            assert new_db is not db
+            new_db.client.close.assert_not_called()
+
+    def test_context_manager_closes_client(self):
+        with _make_db_helper() as db:
+            db.client.close.assert_not_called()
+        db.client.close.assert_called_once()
+
+    def test_max_concurrency_must_be_positive(self):
+        with pytest.raises(ValueError, match="max_concurrency"):
+            DatabaseHelper(
+                api_token="tok",
+                base_url="https://x.com",
+                base_id="base",
+                max_concurrency=0,
+            )
+
     def test_trailing_slash_stripped(self):
         db = _make_db_helper()
         # base_url should not end with /
         assert not db.base_url.endswith("/")
 
 
+# --- Retry client tests ---
+
+
+class TestRetryClient:
+    @staticmethod
+    def _client(statuses, headers=None):
+        """Client whose transport answers with the given statuses in turn."""
+        calls = []
+
+        def handler(request):
+            calls.append(request.method)
+            return httpx.Response(statuses[len(calls) - 1], headers=headers)
+
+        client = RetryClient(
+            base_url="https://x.com",
+            transport=httpx.MockTransport(handler),
+            max_attempts=3,
+        )
+        return client, calls
+
+    @patch("pipelines.common.db_helper.time.sleep")
+    def test_retries_rate_limited_request(self, mock_sleep):
+        client, calls = self._client([429, 200], headers={"Retry-After": "2"})
+
+        response = client.post("/records", content=b"[]")
+
+        assert response.status_code == 200
+        assert calls == ["POST", "POST"]
+        mock_sleep.assert_called_once_with(2.0)
+
+    @patch("pipelines.common.db_helper.time.sleep")
+    def test_gives_up_after_max_attempts(self, mock_sleep):
+        client, calls = self._client([502, 502, 502])
+
+        response = client.get("/records")
+
+        assert response.status_code == 502
+        assert len(calls) == 3
+        assert [c[0][0] for c in mock_sleep.call_args_list] == [1.0, 2.0]
+
+    @patch("pipelines.common.db_helper.time.sleep")
+    def test_does_not_retry_non_idempotent_server_error(self, mock_sleep):
+        client, calls = self._client([502, 200])
+
+        response = client.post("/records", content=b"[]")
+
+        assert response.status_code == 502
+        assert calls == ["POST"]
+        mock_sleep.assert_not_called()
+
+    @pytest.mark.parametrize("method", ["DELETE", "PATCH"])
+    @patch("pipelines.common.db_helper.time.sleep")
+    def test_does_not_retry_write_server_error(self, mock_sleep, method):
+        """The write may have been applied before the gateway failed."""
+        client, calls = self._client([502, 200])
+
+        response = client.request(method, "/records", content=b"[]")
+
+        assert response.status_code == 502
+        assert calls == [method]
+        mock_sleep.assert_not_called()
+
+    @patch("pipelines.common.db_helper.time.sleep")
+    def test_retries_unavailable_delete(self, mock_sleep):
+        client, calls = self._client([503, 200])
+
+        response = client.request("DELETE", "/records", content=b"[]")
+
+        assert response.status_code == 200
+        assert calls == ["DELETE", "DELETE"]
+
+    @patch("pipelines.common.db_helper.time.sleep")
+    def test_retries_connection_error(self, mock_sleep):
+        calls = []
+
+        def handler(request):
+            calls.append(request.method)
+            if len(calls) == 1:
+                raise httpx.ConnectError("connection refused", request=request)
+            return httpx.Response(200)
+
+        client = RetryClient(
+            base_url="https://x.com", transport=httpx.MockTransport(handler)
+        )
+
+        response = client.post("/records", content=b"[]")
+
+        assert response.status_code == 200
+        assert calls == ["POST", "POST"]
+        mock_sleep.assert_called_once_with(1.0)
+
+
 # --- Table mapping tests ---
 
 
@@ -214,6 +433,7 @@ class TestDatabaseHelperLoadFields:
         }
         mock_response.raise_for_status = Mock()
         mock_response.status_code = 200
+        mock_response.content = orjson.dumps(mock_response.json.return_value)
         db_helper.client.get = Mock(return_value=mock_response)
 
         result = db_helper.load_fields(
@@ -235,6 +455,7 @@ class TestDatabaseHelperLoadFields:
         }
         mock_response.raise_for_status = Mock()
         mock_response.status_code = 200
+        mock_response.content = orjson.dumps(mock_response.json.return_value)
         db_helper.client.get = Mock(return_value=mock_response)
 
         result = db_helper.load_fields(
@@ -248,11 +469,45 @@ class TestDatabaseHelperLoadFields:
         assert "(Type,eq,Public)" in params["where"]
         assert result.shape == (1, 3)
 
+    def test_load_fields_field_missing_from_response(self, db_helper):
+        mock_response = Mock()
+        mock_response.json.return_value = {
+            "records": [{"id": 1, "fields": {"Name": "A"}}, {"id": 2, "fields": {}}]
+        }
+        mock_response.raise_for_status = Mock()
+        mock_response.status_code = 200
+        mock_response.content = orjson.dumps(mock_response.json.return_value)
+        db_helper.client.get = Mock(return_value=mock_response)
+
+        result = db_helper.load_fields(
+            table_name="Actor", fields=["Id", "Name", "Email"]
+        )
+
+        assert result.columns == ["Id", "Name", "Email"]
+        assert result["Name"].to_list() == ["A", None]
+        assert result["Email"].to_list() == [None, None]
+
+    def test_load_fields_without_fields_returns_all_columns(self, db_helper):
+        mock_response = Mock()
+        mock_response.json.return_value = {
+            "records": [{"id": 1, "fields": {"Name": "A", "Email": "a@x.org"}}]
+        }
+        mock_response.raise_for_status = Mock()
+        mock_response.status_code = 200
+        mock_response.content = orjson.dumps(mock_response.json.return_value)
+        db_helper.client.get = Mock(return_value=mock_response)
+
+        result = db_helper.load_fields(table_name="Actor")
+
+        assert result.columns == ["Id", "Name", "Email"]
+        assert "fields" not in db_helper.client.get.call_args[1]["params"]
+
     def test_load_fields_with_pagination(self, db_helper):
         mock_response = Mock()
         mock_response.json.return_value = {"records": []}
         mock_response.raise_for_status = Mock()
         mock_response.status_code = 200
+        mock_response.content = orjson.dumps(mock_response.json.return_value)
         db_helper.client.get = Mock(return_value=mock_response)
 
         db_helper.load_fields(
@@ -269,6 +524,7 @@ class TestDatabaseHelperLoadFields:
         mock_response.json.return_value = {"records": []}
         mock_response.raise_for_status = Mock()
         mock_response.status_code = 200
+        mock_response.content = orjson.dumps(mock_response.json.return_value)
         db_helper.client.get = Mock(return_value=mock_response)
 
         result = db_helper.load_fields(
@@ -281,11 +537,31 @@ class TestDatabaseHelperLoadFields:
         assert result.schema["Id"] == pl.Int64
         assert result.schema["Name"] == pl.Utf8
 
+    def test_load_fields_past_last_page(self, db_helper):
+        mock_response = Mock()
+        mock_response.status_code = 422
+        mock_response.content = orjson.dumps({"error": "ERR_INVALID_OFFSET_VALUE"})
+        db_helper.client.get = Mock(return_value=mock_response)
+
+        result = db_helper.load_fields(table_name="Actor", fields=["Id", "Name"])
+
+        assert result.is_empty()
+
+    def test_load_fields_validation_error(self, db_helper):
+        mock_response = Mock()
+        mock_response.status_code = 422
+        mock_response.content = orjson.dumps({"error": "ERR_FIELD_NOT_FOUND"})
+        db_helper.client.get = Mock(return_value=mock_response)
+
+        with pytest.raises(ValueError, match="ERR_FIELD_NOT_FOUND"):
+            db_helper.load_fields(table_name="Actor", fields=["Id", "Nope"])
+
     def test_load_fields_v3_endpoint_construction(self, db_helper):
         mock_response = Mock()
         mock_response.json.return_value = {"records": []}
         mock_response.raise_for_status = Mock()
         mock_response.status_code = 200
+        mock_response.content = orjson.dumps(mock_response.json.return_value)
         db_helper.client.get = Mock(return_value=mock_response)
 
         db_helper.load_fields(table_name="Actor", fields=["Id", "Name"])
@@ -299,6 +575,7 @@ class TestDatabaseHelperLoadFields:
         mock_response.json.return_value = {"records": []}
         mock_response.raise_for_status = Mock()
         mock_response.status_code = 200
+        mock_response.content = orjson.dumps(mock_response.json.return_value)
         db_helper.client.get = Mock(return_value=mock_response)
 
         db_helper.load_fields(
@@ -314,6 +591,277 @@ class TestDatabaseHelperLoadFields:
         assert "(Country,eq,Germany)" in where_clause
         assert "~and" in where_clause
 
+    def test_load_fields_with_view(self, db_helper):
+        mock_response = Mock()
+        mock_response.status_code = 200
+        mock_response.content = orjson.dumps({"records": []})
+        db_helper.client.get = Mock(return_value=mock_response)
+
+        db_helper.load_fields(table_name="Zone", view_id="vw_level_2")
+
+        params = db_helper.client.get.call_args[1]["params"]
+        assert params["viewId"] == "vw_level_2"
+        assert "where" not in params
+
+    def test_load_fields_condition_values_not_quoted(self, db_helper):
+        mock_response = Mock()
+        mock_response.status_code = 200
+        mock_response.content = orjson.dumps({"records": []})
+        db_helper.client.get = Mock(return_value=mock_response)
+
+        db_helper.load_fields(table_name="Zone", condition={"Name": "Île-de-France", "Level": 2})
+
+        params = db_helper.client.get.call_args[1]["params"]
+        assert params["where"] == "(Name,eq,Île-de-France)~and(Level,eq,2)"
+
+    def test_load_fields_condition_none_matches_blank(self, db_helper):
+        mock_response = Mock()
+        mock_response.status_code = 200
+        mock_response.content = orjson.dumps({"records": []})
+        db_helper.client.get = Mock(return_value=mock_response)
+
+        db_helper.load_fields(table_name="Zone", condition={"Name": None, "Level": 2})
+
+        params = db_helper.client.get.call_args[1]["params"]
+        assert params["where"] == "(Name,blank)~and(Level,eq,2)"
+
+
+class TestDatabaseHelperLoadAllRecords:
+    @pytest.fixture
+    def db_helper(self):
+        db = _make_db_helper()
+        db.MAX_PAGE_SIZE = 2
+        return db
+
+    @staticmethod
+    def _mock_pages(total):
+        """Side-effect for client.get serving `total` records in pages."""
+
+        def get(endpoint, params=None, **kwargs):
+            page = params.get("page", 1)
+            size = params["pageSize"]
+            ids = range((page - 1) * size + 1, min(page * size, total) + 1)
+            mock_resp = Mock()
+            mock_resp.raise_for_status = Mock()
+            mock_resp.status_code = 200
+            mock_resp.json.return_value = {
+                "records": [{"id": i, "fields": {"Name": f"n{i}"}} for i in ids]
+            }
+            mock_resp.content = orjson.dumps(mock_resp.json.return_value)
+            return mock_resp
+
+        return get
+
+    def test_load_all_records_fetches_every_page(self, db_helper):
+        db_helper.client.get = Mock(side_effect=self._mock_pages(7))
+
+        result = db_helper.load_all_records("Actor", fields=["Id", "Name"])
+
+        assert result["Id"].to_list() == list(range(1, 8))
+        assert result.columns == ["Id", "Name"]
+
+    def test_load_all_records_requests_no_page_past_the_end(self, db_helper):
+        db_helper.client.get = Mock(side_effect=self._mock_pages(7))
+
+        db_helper.load_all_records("Actor", fields=["Id", "Name"])
+
+        # pages 1, 2 and 3-4; page 4 is short, so the scan stops there
+        pages = [c[1]["params"].get("page", 1) for c in db_helper.client.get.call_args_list]
+        assert sorted(pages) == [1, 2, 3, 4]
+
+    def test_load_all_records_stops_on_empty_page(self, db_helper):
+        """An empty page ends the scan even if NocoDB still sends a next link."""
+
+        def get(endpoint, params=None, **kwargs):
+            page = params.get("page", 1)
+            records = [{"id": i, "fields": {}} for i in (1, 2)] if page == 1 else []
+            mock_resp = Mock()
+            mock_resp.status_code = 200
+            mock_resp.content = orjson.dumps({"records": records, "next": "more"})
+            return mock_resp
+
+        db_helper.client.get = Mock(side_effect=get)
+
+        result = db_helper.load_all_records("Actor", fields=["Id"])
+
+        assert result["Id"].to_list() == [1, 2]
+        assert db_helper.client.get.call_count == 2
+
+    def test_load_all_records_without_record_id(self, db_helper):
+        """A record without an id is kept, with a null Id."""
+        mock_resp = Mock()
+        mock_resp.status_code = 200
+        mock_resp.content = orjson.dumps(
+            {
+                "records": [{"id": 1, "fields": {"Name": "a"}}, {"fields": {"Name": "b"}}],
+                "next": None,
+            }
+        )
+        db_helper.client.get = Mock(return_value=mock_resp)
+
+        result = db_helper.load_all_records("Actor", fields=["Id", "Name"])
+
+        assert result.rows() == [(1, "a"), (None, "b")]
+
+    def test_load_all_records_single_page(self, db_helper):
+        db_helper.client.get = Mock(side_effect=self._mock_pages(1))
+
+        result = db_helper.load_all_records("Actor", fields=["Id", "Name"])
+
+        assert result["Id"].to_list() == [1]
+        assert db_helper.client.get.call_count == 1
+
+    def test_load_all_records_stops_on_next_link(self, db_helper):
+        mock_response = Mock()
+        mock_response.raise_for_status = Mock()
+        mock_response.status_code = 200
+        mock_response.json.return_value = {
+            "records": [{"id": 1, "fields": {}}, {"id": 2, "fields": {}}],
+            "next": None,
+        }
+        mock_response.content = orjson.dumps(mock_response.json.return_value)
+        db_helper.client.get = Mock(return_value=mock_response)
+
+        result = db_helper.load_all_records("Actor", fields=["Id"])
+
+        assert len(result) == 2
+        assert db_helper.client.get.call_count == 1
+
+
+class TestDatabaseHelperInsertRecords:
+    @pytest.fixture
+    def db_helper(self):
+        return _make_db_helper()
+
+    @staticmethod
+    def _mock_insert_post(endpoint, content=None, **kwargs):
+        """Echo back each record with an id derived from its Name."""
+        mock_resp = Mock()
+        mock_resp.raise_for_status = Mock()
+        mock_resp.status_code = 200
+        mock_resp.json.return_value = {
+            "records": [
+                {"id": int(r["fields"]["Name"][1:]), "fields": r["fields"]}
+                for r in orjson.loads(content)
+            ]
+        }
+        mock_resp.content = orjson.dumps(mock_resp.json.return_value)
+        return mock_resp
+
+    def test_insert_records_batches_and_ids(self, db_helper):
+        db_helper.client.post = Mock(side_effect=self._mock_insert_post)
+
+        df = pl.DataFrame({"Name": [f"n{i}" for i in range(25)]})
+        result = db_helper.insert_records(df, "Actor", batch_size=10)
+
+        assert db_helper.client.post.call_count == 3
+        assert result["Id"].to_list() == list(range(25))
+        assert result["Name"].to_list() == df["Name"].to_list()
+
+    def test_insert_records_splits_large_payloads(self, db_helper):
+        db_helper.client.post = Mock(side_effect=self._mock_insert_post)
+        db_helper.MAX_BATCH_BYTES = 100
+
+        df = pl.DataFrame({"Name": [f"n{i}" for i in range(4)], "Geometry": ["x" * 60] * 4})
+        result = db_helper.insert_records(df, "Actor")
+
+        assert db_helper.client.post.call_count == 4
+        assert result["Id"].to_list() == [0, 1, 2, 3]
+
+    def test_insert_records_validation_error(self, db_helper):
+        mock_resp = Mock()
+        mock_resp.status_code = 422
+        mock_resp.content = b"<html>Invalid field</html>" + b"x" * 5000
+        db_helper.client.post = Mock(return_value=mock_resp)
+
+        with pytest.raises(ValueError, match="Failed to insert records: <html>Invalid") as exc:
+            db_helper.insert_records(pl.DataFrame({"Name": ["n1"]}), "Actor")
+        assert len(str(exc.value)) < 2100
+
+    def test_insert_records_empty(self, db_helper):
+        db_helper.client.post = Mock()
+
+        result = db_helper.insert_records(pl.DataFrame({"Name": []}), "Actor")
+
+        assert result.schema["Id"] == pl.Int64
+        db_helper.client.post.assert_not_called()
+
+
+class TestDatabaseHelperUpdateRecords:
+    @pytest.fixture
+    def db_helper(self):
+        return _make_db_helper()
+
+    def test_update_records_payload(self, db_helper):
+        mock_response = Mock()
+        mock_response.raise_for_status = Mock()
+        mock_response.status_code = 200
+        db_helper.client.patch = Mock(return_value=mock_response)
+
+        df = pl.DataFrame({"Id": [1, None, 3], "Geometry": ["a", "b", "c"]})
+        result = db_helper.update_records(df, "Zone")
+
+        payload = orjson.loads(db_helper.client.patch.call_args[1]["content"])
+        assert payload == [
+            {"id": "1", "fields": {"Geometry": "a"}},
+            {"id": "3", "fields": {"Geometry": "c"}},
+        ]
+        assert result["Id"].to_list() == [1, 3]
+
+    def test_update_records_without_fields(self, db_helper):
+        db_helper.client.patch = Mock()
+
+        result = db_helper.update_records(pl.DataFrame({"Id": [1, 2]}), "Zone")
+
+        db_helper.client.patch.assert_not_called()
+        assert result["Id"].to_list() == [1, 2]
+
+    def test_update_records_missing_id_column(self, db_helper):
+        with pytest.raises(ValueError, match="Id"):
+            db_helper.update_records(pl.DataFrame({"Geometry": ["a"]}), "Zone")
+
+
+class TestDatabaseHelperDeleteRecords:
+    @pytest.fixture
+    def db_helper(self):
+        return _make_db_helper()
+
+    def test_delete_records_batches(self, db_helper):
+        mock_response = Mock()
+        mock_response.status_code = 200
+        db_helper.client.request = Mock(return_value=mock_response)
+
+        ids = list(range(1, 24))
+        # nulls scattered between the 23 ids are skipped
+        df = pl.DataFrame({"Id": ids[:5] + [None] + ids[5:20] + [None, None] + ids[20:]})
+        db_helper.delete_records(df, "Zone")
+
+        assert db_helper.client.request.call_count == 3
+        endpoint = db_helper._records_endpoint("Zone")
+        payloads = []
+        for call in db_helper.client.request.call_args_list:
+            assert call[0] == ("DELETE", endpoint)
+            payloads.append(orjson.loads(call[1]["content"]))
+        # batches are sent concurrently, so their order is not fixed
+        payloads.sort(key=lambda payload: int(payload[0]["id"]))
+        assert [len(payload) for payload in payloads] == [10, 10, 3]
+        assert payloads == [
+            [{"id": str(i)} for i in ids[0:10]],
+            [{"id": str(i)} for i in ids[10:20]],
+            [{"id": str(i)} for i in ids[20:23]],
+        ]
+
+    def test_delete_records_only_nulls(self, db_helper):
+        db_helper.client.request = Mock()
+
+        db_helper.delete_records(pl.DataFrame({"Id": [None, None]}), "Zone")
+
+        db_helper.client.request.assert_not_called()
+
+    def test_delete_records_missing_id_column(self, db_helper):
+        with pytest.raises(ValueError, match="Id"):
+            db_helper.delete_records(pl.DataFrame({"Name": ["a"]}), "Zone")
+
 
 class TestDatabaseHelperLinkRecords:
     @pytest.fixture
@@ -340,9 +888,27 @@ class TestDatabaseHelperLinkRecords:
         df = pl.DataFrame({"Id": [1], "Zone_ids": [[10, 20, 30]]})
         db_helper.link_records(df, "Actor", "Zones", "Zone_ids")
 
-        payload = db_helper.client.post.call_args[1]["json"]
+        payload = orjson.loads(db_helper.client.post.call_args[1]["content"])
         assert len(payload) == 3
 
+    def test_link_records_groups_rows_per_record(self, db_helper):
+        mock_response = Mock()
+        mock_response.raise_for_status = Mock()
+        mock_response.status_code = 200
+        db_helper.client.post = Mock(return_value=mock_response)
+
+        df = pl.DataFrame({"Id": [1, 1, 2, 3], "Zone_id": [10, 20, 10, None]})
+        db_helper.link_records(df, "Actor", "Zones", "Zone_id")
+
+        payloads = {
+            call[0][0].rsplit("/", 1)[1]: orjson.loads(call[1]["content"])
+            for call in db_helper.client.post.call_args_list
+        }
+        assert payloads == {
+            "1": [{"id": "10"}, {"id": "20"}],
+            "2": [{"id": "10"}],
+        }
+
     def test_link_records_unknown_table(self, db_helper):
         df = pl.DataFrame({"Id": [1], "fk": [10]})
         with pytest.raises(ValueError, match="no link fields"):
@@ -0,0 +1,44 @@
+"""Tests for the services module."""
+
+from unittest.mock import patch
+
+import pytest
+
+from pipelines.common import services
+
+
+@pytest.fixture
+def nocodb_env(monkeypatch):
+    monkeypatch.setenv("NOCODB_API_TOKEN", "tok")
+    monkeypatch.setenv("NOCODB_URL", "https://x.com")
+    monkeypatch.setenv("BASE_ID", "base")
+    monkeypatch.delenv("NOCODB_SCHEMA_CACHE_DIR", raising=False)
+    monkeypatch.delenv("NOCODB_MAX_CONCURRENCY", raising=False)
+
+
+class TestDbHelper:
+
+    def test_default_max_concurrency(self, nocodb_env):
+        with patch.object(services.DatabaseHelper, "shared") as shared:
+            services.db_helper()
+
+        assert shared.call_args[1]["max_concurrency"] == 8
+
+    def test_max_concurrency_from_env(self, nocodb_env, monkeypatch):
+        monkeypatch.setenv("NOCODB_MAX_CONCURRENCY", "3")
+        with patch.object(services.DatabaseHelper, "shared") as shared:
+            services.db_helper()
+
+        assert shared.call_args[1]["max_concurrency"] == 3
+
+    @pytest.mark.parametrize(
+        "value, message",
+        [("0", "at least 1"), ("-2", "at least 1"), ("", "integer"), ("four", "integer")],
+    )
+    def test_invalid_max_concurrency(self, nocodb_env, monkeypatch, value, message):
+        monkeypatch.setenv("NOCODB_MAX_CONCURRENCY", value)
+        with patch.object(services.DatabaseHelper, "shared") as shared:
+            with pytest.raises(ValueError, match=f"NOCODB_MAX_CONCURRENCY must be.*{message}"):
+                services.db_helper()
+
+        shared.assert_not_called()
@@ -3,6 +3,7 @@ import logging
 from pathlib import Path
 
 import pytest
+from prefect.testing.utilities import prefect_test_harness
 
 
 @pytest.fixture
@@ -17,10 +18,11 @@ def test_data_dir(project_root):
     return project_root / "data"
 
 
-@pytest.fixture(autouse=True)
+@pytest.fixture(autouse=True, scope="session")
 def _mock_prefect_logger():
     """Disable Prefect run loggers so get_run_logger() returns a null logger
-    instead of raising MissingContextError outside a flow/task context."""
+    instead of raising MissingContextError outside a flow/task context.
+    Done once for the whole session, no test needs them enabled."""
     flow_logger = logging.getLogger("prefect.flow_runs")
     task_logger = logging.getLogger("prefect.task_runs")
     flow_logger.disabled = True
@@ -28,3 +30,10 @@ def _mock_prefect_logger():
     yield
     flow_logger.disabled = False
     task_logger.disabled = False
+
+
+@pytest.fixture(scope="module")
+def prefect_harness():
+    """Run flows against a temporary Prefect database."""
+    with prefect_test_harness():
+        yield
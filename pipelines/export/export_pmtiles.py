@@ -1,9 +1,9 @@
 """
 Prefect workflow to export zone data from NocoDB as PMTiles.
 
-Reads zone records (Country, DistributionZone) from NocoDB, produces a GeoJSON
-FeatureCollection per table in data/staging, then converts them to PMTiles in
-data/export.
+Reads zone records (Country, DistributionZone) from NocoDB, produces a
+newline-delimited GeoJSON file (one Feature per line) per table in data/staging,
+then converts them to PMTiles in data/export.
 
 Output GeoJSON fields per feature:
  - Geometry (from NocoDB)
@@ -11,10 +11,11 @@ Output GeoJSON fields per feature:
  - VCM Level
 """
 
-import json
 import subprocess
 from pathlib import Path
 
+import polars as pl
+import shapely
 from prefect import flow, get_run_logger, task
 from prefect.cache_policies import NO_CACHE
 
@@ -25,14 +26,26 @@ ZONE_FIELDS = ["Code", "Name", "Geometry", "PVC Level", "VCM Level"]
 ZONE_TABLES = {
     "Country": "data_countries",
 }
+# Values of "type" a GeoJSON geometry object may have (RFC 7946)
+GEOJSON_GEOMETRY_TYPES = [
+    "Point",
+    "MultiPoint",
+    "LineString",
+    "MultiLineString",
+    "Polygon",
+    "MultiPolygon",
+    "GeometryCollection",
+]
 
 
 @task(name="export_zones_geojson", cache_policy=NO_CACHE)
 def export_zones_geojson_task(table_name: str, output_dir: Path) -> Path:
     """
-    Read all records from a zone table and write a GeoJSON FeatureCollection.
+    Read all records from a zone table and write its features as newline-delimited
+    GeoJSON (one Feature per line), which tippecanoe can parse in parallel.
 
-    Records without geometry are skipped.
+    Records without geometry are skipped, and so are records whose geometry is not
+    a valid GeoJSON geometry (logged), since it is embedded in the output as is.
 
     Returns:
         Path to the written GeoJSON file.
@@ -43,37 +56,61 @@ def export_zones_geojson_task(table_name: str, output_dir: Path) -> Path:
     df = db_helper.load_all_records(table_name=table_name, fields=ZONE_FIELDS)
     logger.info(f"Loaded {len(df)} records from {table_name}")
 
-    features = []
-    skipped = 0
-    for row in df.iter_rows(named=True):
-        geometry_str = row.get("Geometry")
-        if not geometry_str:
-            skipped += 1
-            continue
-        geometry = json.loads(geometry_str)
-        feature = {
-            "type": "Feature",
-            "geometry": geometry,
-            "properties": {
-                "code": row["Code"],
-                "name": row["Name"],
-                "pvc_level": row.get("PVC Level"),
-                "vcm_level": row.get("VCM Level"),
-            },
-        }
-        features.append(feature)
-
+    # A Geometry column that is null in every record is loaded with the Null dtype
+    df = df.with_columns(pl.col("Geometry").cast(pl.Utf8))
+    df_with_geometry = df.filter(
+        pl.col("Geometry").is_not_null() & (pl.col("Geometry") != "")
+    )
+    skipped = len(df) - len(df_with_geometry)
     if skipped:
         logger.warning(f"Skipped {skipped} records without geometry")
 
-    collection = {
-        "type": "FeatureCollection",
-        "features": features,
-    }
+    # The geometry text is embedded without being re-encoded, so check it first: a
+    # malformed one would corrupt its line and make tippecanoe reject the file
+    is_valid = (
+        pl.Series(
+            ~shapely.is_missing(
+                shapely.from_geojson(
+                    df_with_geometry["Geometry"].to_numpy(), on_invalid="ignore"
+                )
+            )
+        )
+        & df_with_geometry["Geometry"]
+        .str.json_path_match("$.type")
+        .is_in(GEOJSON_GEOMETRY_TYPES)
+    ).fill_null(False)
+    invalid = df_with_geometry.filter(~is_valid)
+    if len(invalid):
+        logger.warning(
+            f"Skipped {len(invalid)} records with an invalid geometry: "
+            f"{invalid['Code'].head(10).to_list()}"
+        )
+
+    # Build each feature line in Polars: the stored geometry is already GeoJSON text,
+    # so it is embedded as is (without raw line breaks) instead of being re-encoded
+    features = df_with_geometry.filter(is_valid).select(
+        pl.concat_str(
+            pl.lit('{"type":"Feature","geometry":'),
+            pl.col("Geometry").str.replace_all(r"[\r\n]", ""),
+            pl.lit(',"properties":'),
+            pl.struct(
+                pl.col("Code").alias("code"),
+                pl.col("Name").alias("name"),
+                pl.col("PVC Level").alias("pvc_level"),
+                pl.col("VCM Level").alias("vcm_level"),
+            ).struct.json_encode(),
+            pl.lit("}"),
+        ).alias("feature")
+    )
 
     output_dir.mkdir(parents=True, exist_ok=True)
-    output_path = output_dir / f"{table_name}_tile_data.geojson"
-    output_path.write_text(json.dumps(collection), encoding="utf-8")
+    output_path = output_dir / f"{table_name}_tile_data.geojsonl"
+
+    # Stream the features to the file, one per line, a slice at a time
+    with output_path.open("w", encoding="utf-8") as output:
+        for features_slice in features.iter_slices(n_rows=1000):
+            output.writelines(line + "\n" for line in features_slice["feature"])
+
     logger.info(f"Wrote {len(features)} features to {output_path}")
     return output_path
 
@@ -83,6 +120,9 @@ def create_pmtiles_task(geojson_file: Path, layer: str, output_dir: Path) -> Pat
     """
     Convert a GeoJSON file to a PMTiles archive using tippecanoe.
 
+    Newline-delimited input (.geojsonl, as exported) is read by several threads at
+    once (-P); any other file is read as a regular GeoJSON FeatureCollection.
+
     Args:
         geojson_file: Path to the input GeoJSON file.
         layer: Layer name for the vector tiles (e.g. "data_countries").
@@ -95,9 +135,10 @@ def create_pmtiles_task(geojson_file: Path, layer: str, output_dir: Path) -> Pat
     output_dir.mkdir(parents=True, exist_ok=True)
     pmtiles_file = output_dir / f"{layer}.pmtiles"
 
-    command = [
-        "tippecanoe",
-        "-zg",
+    command = ["tippecanoe", "-zg"]
+    if geojson_file.suffix == ".geojsonl":
+        command.append("-P")
+    command += [
         "--force",
         "-o",
         str(pmtiles_file),
@@ -120,7 +161,7 @@ def export_pmtiles_flow(data_directory: Path) -> None:
     Export zone data from NocoDB to PMTiles.
 
     Steps:
-      1. For each zone table, export a GeoJSON FeatureCollection to data/staging.
+      1. For each zone table, export newline-delimited GeoJSON to data/staging.
       2. Convert the GeoJSON files to PMTiles in data/export.
     """
     staging_dir = data_directory / "staging"
@@ -12,7 +12,7 @@ from pipelines.export.export_pmtiles import create_pmtiles_task, export_zones_ge
 
 class TestExportZonesGeojson:
 
-    def test_produces_valid_feature_collection(self, tmp_path):
+    def test_produces_one_feature_per_line(self, tmp_path):
         """Records with geometry become Features; records without are skipped."""
         fake_df = pl.DataFrame({
             "Code": ["DE", "FR", "XX"],
@@ -36,24 +36,85 @@ class TestExportZonesGeojson:
                 table_name="Country", output_dir=tmp_path
             )
 
-        assert path == tmp_path / "Country_tile_data.geojson"
+        assert path == tmp_path / "Country_tile_data.geojsonl"
 
-        collection = json.loads(path.read_text())
-        assert collection["type"] == "FeatureCollection"
-        assert len(collection["features"]) == 2
+        features = [json.loads(line) for line in path.read_text().splitlines()]
+        assert len(features) == 2
+        assert all(feature["type"] == "Feature" for feature in features)
 
-        de = collection["features"][0]
+        de = features[0]
         assert de["properties"]["code"] == "DE"
         assert de["properties"]["pvc_level"] == "High"
         assert de["properties"]["vcm_level"] == "Medium"
         assert de["geometry"]["type"] == "Polygon"
 
-        fr = collection["features"][1]
+        fr = features[1]
         assert fr["properties"]["code"] == "FR"
         assert fr["properties"]["vcm_level"] is None
 
-    def test_empty_table_produces_empty_collection(self, tmp_path):
-        """An empty table should produce a valid but empty FeatureCollection."""
+    def test_multiline_geometry_stays_on_one_line(self, tmp_path):
+        """Pretty-printed geometries must not split a feature across lines."""
+        geometry = {"type": "Point", "coordinates": [1.5, 2.5]}
+        fake_df = pl.DataFrame({
+            "Code": ["DE"],
+            "Name": ["Germany"],
+            "Geometry": [json.dumps(geometry, indent=2)],
+            "PVC Level": ["High"],
+            "VCM Level": [None],
+        })
+
+        mock_db = Mock()
+        mock_db.load_all_records.return_value = fake_df
+
+        with patch("pipelines.export.export_pmtiles.services") as mock_services:
+            mock_services.db_helper.return_value = mock_db
+
+            path = export_zones_geojson_task.fn(
+                table_name="Country", output_dir=tmp_path
+            )
+
+        lines = path.read_text().splitlines()
+        assert len(lines) == 1
+        assert json.loads(lines[0])["geometry"] == geometry
+
+    def test_skips_invalid_geometries(self, tmp_path):
+        """Geometries that are not valid GeoJSON geometries are not embedded."""
+        point = '{"type":"Point","coordinates":[1,2]}'
+        fake_df = pl.DataFrame({
+            "Code": ["OK", "TXT", "CUT", "FEAT", "NOCOORD"],
+            "Name": ["Valid", "Not JSON", "Truncated", "Feature", "No coordinates"],
+            "Geometry": [
+                point,
+                "not json",
+                point[:-2],
+                '{"type":"Feature","geometry":' + point + ',"properties":{}}',
+                '{"type":"Point"}',
+            ],
+            "PVC Level": [None] * 5,
+            "VCM Level": [None] * 5,
+        })
+
+        mock_db = Mock()
+        mock_db.load_all_records.return_value = fake_df
+
+        with (
+            patch("pipelines.export.export_pmtiles.services") as mock_services,
+            patch("pipelines.export.export_pmtiles.get_run_logger") as mock_logger,
+        ):
+            mock_services.db_helper.return_value = mock_db
+
+            path = export_zones_geojson_task.fn(
+                table_name="Country", output_dir=tmp_path
+            )
+
+        features = [json.loads(line) for line in path.read_text().splitlines()]
+        assert [feature["properties"]["code"] for feature in features] == ["OK"]
+        warning = mock_logger.return_value.warning.call_args[0][0]
+        assert "Skipped 4 records with an invalid geometry" in warning
+        assert "TXT" in warning
+
+    def test_empty_table_produces_empty_file(self, tmp_path):
+        """An empty table should produce an empty file, with no features."""
         fake_df = pl.DataFrame(
             schema={
                 "Code": pl.Utf8,
@@ -74,8 +135,33 @@ class TestExportZonesGeojson:
                 table_name="Country", output_dir=tmp_path
             )
 
-        collection = json.loads(path.read_text())
-        assert collection["features"] == []
+        assert path.read_text() == ""
+
+    def test_all_null_geometries_produce_empty_file(self, tmp_path):
+        """A Geometry column null in every record (Null dtype) is skipped entirely."""
+        fake_df = pl.DataFrame(
+            [
+                {"Code": "DE", "Name": "Germany", "Geometry": None},
+                {"Code": "FR", "Name": "France", "Geometry": None},
+            ],
+            infer_schema_length=None,
+        ).with_columns(
+            pl.lit(None, dtype=pl.Utf8).alias("PVC Level"),
+            pl.lit(None, dtype=pl.Utf8).alias("VCM Level"),
+        )
+        assert fake_df["Geometry"].dtype == pl.Null
+
+        mock_db = Mock()
+        mock_db.load_all_records.return_value = fake_df
+
+        with patch("pipelines.export.export_pmtiles.services") as mock_services:
+            mock_services.db_helper.return_value = mock_db
+
+            path = export_zones_geojson_task.fn(
+                table_name="Country", output_dir=tmp_path
+            )
+
+        assert path.read_text() == ""
 
 
 def _sample_geojson() -> dict:
@@ -136,6 +222,37 @@ class TestCreatePmtiles:
         assert output_dir.is_dir()
         assert result.exists()
 
+    def test_accepts_newline_delimited_features(self, tmp_path):
+        """Line-delimited features (as exported) are read in parallel with -P."""
+        geojson_file = tmp_path / "input.geojsonl"
+        geojson_file.write_text(
+            "".join(json.dumps(f) + "\n" for f in _sample_geojson()["features"])
+        )
+
+        result = create_pmtiles_task.fn(
+            geojson_file=geojson_file, layer="data_countries", output_dir=tmp_path
+        )
+
+        assert result.stat().st_size > 0
+
+    @pytest.mark.parametrize(
+        "file_name, parallel", [("input.geojsonl", True), ("input.geojson", False)]
+    )
+    def test_reads_in_parallel_only_newline_delimited_files(
+        self, tmp_path, file_name, parallel
+    ):
+        """-P is only passed for .geojsonl files, FeatureCollections are read as is."""
+        with patch("pipelines.export.export_pmtiles.subprocess.run") as mock_run:
+            create_pmtiles_task.fn(
+                geojson_file=tmp_path / file_name,
+                layer="data_countries",
+                output_dir=tmp_path,
+            )
+
+        command = mock_run.call_args[0][0]
+        assert ("-P" in command) is parallel
+        assert command[-1] == str(tmp_path / file_name)
+
     def test_overwrites_existing_file(self, tmp_path):
         """--force flag allows idempotent re-runs."""
         geojson_file = tmp_path / "input.geojson"
@@ -5,17 +5,61 @@ Then uses the DE WasserPortal API to get the water company for each municipality
 The data is saved as JSON (line delimited) in data/staging/WaterCompany_de_wasserportal.ndjson.
 """
 
-import json
+import atexit
+import threading
+from datetime import timedelta
 from pathlib import Path
 import httpx
+import orjson
 from prefect.cache_policies import INPUTS, NO_CACHE
-from shapely.geometry import shape
+import shapely
 from prefect import flow, get_run_logger, task
 from prefect.concurrency.sync import rate_limit
+from prefect.task_runners import ThreadPoolTaskRunner
 import polars as pl
 
+# Number of WasserPortal lookups in flight at once; the request rate itself is
+# still bounded by the "water-api" rate limit
+MAX_CONCURRENT_REQUESTS = 20
 
-@task(name="get_water_company", cache_policy=INPUTS)
+# Client returned by wasserportal_client(), created by the first lookup
+_CLIENT: httpx.Client | None = None
+# Lookups run in worker threads, so the client must not be created twice
+_CLIENT_LOCK = threading.Lock()
+
+
+def wasserportal_client() -> httpx.Client:
+    """
+    Get the HTTP client shared by every lookup of this process, created on first use.
+    Requests reuse its kept-alive connections instead of opening a new TCP/TLS
+    connection each time. It is closed when the interpreter exits.
+    """
+    global _CLIENT
+    client = _CLIENT
+    if client is not None:
+        return client
+    with _CLIENT_LOCK:
+        if _CLIENT is None:
+            _CLIENT = httpx.Client(
+                timeout=30.0,
+                http2=True,
+                limits=httpx.Limits(
+                    max_connections=MAX_CONCURRENT_REQUESTS,
+                    max_keepalive_connections=MAX_CONCURRENT_REQUESTS,
+                ),
+            )
+            atexit.register(_CLIENT.close)
+        return _CLIENT
+
+
+# Lookups are cached on disk by coordinates (PREFECT_LOCAL_STORAGE_PATH), so re-runs
+# only call the API for new municipalities; a cache hit also skips the rate limit
+@task(
+    name="get_water_company",
+    cache_policy=INPUTS,
+    persist_result=True,
+    cache_expiration=timedelta(days=30),
+)
 def get_water_company(lat: float, lon: float) -> dict | None:
     """
     Uses DE WasserPortal API to get the water company for a given latitude and longitude.
@@ -32,7 +76,7 @@ def get_water_company(lat: float, lon: float) -> dict | None:
     rate_limit("water-api")
     url = f"https://api.wasserportal.info/api/public/findgebiet?latitude={lat}&longitude={lon}"
     get_run_logger().info(url)
-    response = httpx.get(url, timeout=30.0)
+    response = wasserportal_client().get(url)
     response.raise_for_status()
     # time.sleep(2)
     if response.status_code == 204:
@@ -40,7 +84,7 @@ def get_water_company(lat: float, lon: float) -> dict | None:
             f"No company found for latitude {lat} and longitude {lon}"
         )
         return None
-    data = response.json()
+    data = orjson.loads(response.content)
     company = data.get("versorger")
     if not company:
         get_run_logger().info(
@@ -56,32 +100,28 @@ def get_water_company(lat: float, lon: float) -> dict | None:
     }
 
 
-@task(name="get_water_companies")
-def get_water_companies_task(municipalities_df: pl.DataFrame) -> pl.DataFrame:
+def collect_water_companies(
+    municipalities: list[str], water_companies: list[dict | BaseException | None]
+) -> list[dict]:
     """
-    Retrieve water companies for the municipalities in the dataframe.
-    Return a dataframe with the following fields:
-    - Name: str
-    - Phone: str
-    - Email: str
-    - Website: str
-    - Description: str
-    - Municipality: str
+    Pair each municipality with the result of its water company lookup, in order.
+    water_companies holds the get_water_company results of a .map() call, failed
+    lookups included (as their exception) when the results were gathered with
+    raise_on_failure=False.
+    Return one dict per municipality served by a company, with the company fields
+    and the municipality as "Municipality". Municipalities without a company are
+    skipped, and so are failed lookups (logged), so that one failing request does
+    not discard every other lookup of the run.
     """
     companies = []
-    count = len(municipalities_df)
-    for i, row in enumerate(municipalities_df[0:305].iter_rows(named=True)):
-        get_run_logger().info(
-            f"Processing municipality {i+1} of {count}: {row['Name']}"
-        )
-        geometry = json.loads(row["Geometry"])
-        poly = shape(geometry)
-        center = poly.centroid
-        lat, lon = center.y, center.x
-        water_company = get_water_company(lat, lon)
-        if water_company:
-            companies.append({**water_company, "Municipality": row["Name"]})
-    return pl.DataFrame(companies)
+    for municipality, water_company in zip(municipalities, water_companies):
+        if isinstance(water_company, BaseException):
+            get_run_logger().warning(
+                f"Water company lookup failed for {municipality}: {water_company}"
+            )
+        elif water_company:
+            companies.append({**water_company, "Municipality": municipality})
+    return companies
 
 
 @task(name="get_existing_de_municipalities")
@@ -89,14 +129,37 @@ def get_existing_de_municipalities_task(
     country_code: str, data_directory: Path
 ) -> pl.DataFrame:
     """
-    Get existing DE municipalities from the database.
+    Get existing DE municipalities from the staging data.
     Return a dataframe with the following fields:
     - Code: str
     - Name: str
-    - Geometry: GeoJSON
+    - Latitude: float (of the geometry centroid)
+    - Longitude: float (of the geometry centroid)
+
+    Geometries are reduced to their centroid here, so the (large) polygons are not
+    carried through the rest of the flow. Municipalities with a missing, empty or
+    invalid geometry have no centroid to look up and are skipped.
     """
-    return pl.read_ndjson(data_directory / "staging" / "Municipality.ndjson").filter(
-        pl.col("CountryCode") == country_code
+    df = (
+        pl.scan_ndjson(data_directory / "staging" / "Municipality.ndjson")
+        .filter(pl.col("CountryCode") == country_code)
+        .select("Code", "Name", "Geometry")
+        .collect()
+    )
+    # Parse all geometries and compute their centroids at once, in GEOS
+    geometries = shapely.from_geojson(df["Geometry"].to_numpy(), on_invalid="ignore")
+    has_geometry = ~(shapely.is_missing(geometries) | shapely.is_empty(geometries))
+    if not has_geometry.all():
+        get_run_logger().warning(
+            f"Skipping {(~has_geometry).sum()} municipalities without a geometry"
+        )
+        df = df.filter(pl.Series(has_geometry))
+        geometries = geometries[has_geometry]
+    centers = shapely.centroid(geometries)
+    # Rounded (~10 cm) so the lookup cache key does not depend on float noise
+    return df.select("Code", "Name").with_columns(
+        pl.Series("Latitude", shapely.get_y(centers)).round(6),
+        pl.Series("Longitude", shapely.get_x(centers)).round(6),
     )
 
 
@@ -119,23 +182,25 @@ def merge_water_companies_task(water_companies_df: pl.DataFrame) -> pl.DataFrame
     )
 
 
-@flow(name="download_de_wasserportal", persist_result=True)
+@flow(
+    name="download_de_wasserportal",
+    persist_result=True,
+    task_runner=ThreadPoolTaskRunner(max_workers=MAX_CONCURRENT_REQUESTS),
+)
 def download_de_wasserportal(data_directory: Path):
+    logger = get_run_logger()
     municipalities_df = get_existing_de_municipalities_task("DE", data_directory)
-    # Submit all water company lookups as independent tasks
-    companies = []
-    count = len(municipalities_df)
-    for i, row in enumerate(municipalities_df.iter_rows(named=True)):
-        get_run_logger().info(
-            f"Processing municipality {i+1} of {count}: {row['Name']}"
-        )
-        geometry = json.loads(row["Geometry"])
-        poly = shape(geometry)
-        center = poly.centroid
-        lat, lon = center.y, center.x
-        muni = get_water_company(lat, lon)
-        if muni:
-            companies.append({**muni, "Municipality": row["Code"]})
+    logger.info(
+        f"Looking up water companies for {len(municipalities_df)} municipalities"
+    )
+    # Submit all water company lookups as independent tasks, run by the task runner
+    water_companies = get_water_company.map(
+        municipalities_df["Latitude"].to_list(),
+        municipalities_df["Longitude"].to_list(),
+    ).result(raise_on_failure=False)
+    companies = collect_water_companies(
+        municipalities_df["Code"].to_list(), water_companies
+    )
 
     water_companies_df = pl.DataFrame(companies)
     water_companies_df = merge_water_companies_task(water_companies_df)
@@ -7,6 +7,9 @@ from prefect import flow, task
 import pyogrio
 from urllib.request import urlretrieve
 
+# Features read, reprojected and written at a time, to bound peak memory
+CONVERT_CHUNK_SIZE = 50_000
+
 
 @task(name="download commune gpkg")
 def download_commune_gpkg(dest_directory: Path) -> Path:
@@ -24,18 +27,36 @@ def download_commune_gpkg(dest_directory: Path) -> Path:
 def convert_gpkg_to_geojson(gpkg_file: Path, output_path: Path):
     """
     Convert postal codes in GPKG file to GeoJSON.
+    The file is converted CONVERT_CHUNK_SIZE features at a time.
     """
     if output_path.exists():
         return output_path
-    gdf = pyogrio.read_dataframe(gpkg_file)
-    gdf = gdf.to_crs(epsg=4326)
+    # Write to a temporary file first, so an interrupted conversion is not taken as done
+    tmp_path = output_path.with_suffix(".tmp.geojson")
+    tmp_path.unlink(missing_ok=True)
+    # -1 when the driver cannot count features cheaply: chunks are then read until
+    # a short (or empty) one comes back
+    feature_count = pyogrio.read_info(gpkg_file)["features"]
+    offset = 0
+    while True:
+        gdf = pyogrio.read_dataframe(
+            gpkg_file, skip_features=offset, max_features=CONVERT_CHUNK_SIZE
+        )
+        # The first chunk is always written, so an empty source still gives a file
+        if gdf.empty and offset > 0:
+            break
+        gdf = gdf.to_crs(epsg=4326)
 
-    # Replace "UK" with "GB" in CNTR_CODE property if it exists
-    if "CNTR_CODE" in gdf.columns:
-        gdf["CNTR_CODE"] = gdf["CNTR_CODE"].replace("UK", "GB")
+        # Replace "UK" with "GB" in CNTR_CODE property if it exists
+        if "CNTR_CODE" in gdf.columns:
+            gdf["CNTR_CODE"] = gdf["CNTR_CODE"].replace("UK", "GB")
 
-    # Write to GeoJSON using pyogrio
-    pyogrio.write_dataframe(gdf, output_path, driver="GeoJSON")
+        # Write to GeoJSON using pyogrio, appending after the first chunk
+        pyogrio.write_dataframe(gdf, tmp_path, driver="GeoJSON", append=offset > 0)
+        offset += len(gdf)
+        if len(gdf) < CONVERT_CHUNK_SIZE or 0 <= feature_count <= offset:
+            break
+    tmp_path.rename(output_path)
 
     return output_path
 
@@ -0,0 +1,259 @@
+"""Tests for the DE WasserPortal workflow."""
+
+import time
+from concurrent.futures import ThreadPoolExecutor
+from unittest.mock import Mock, patch
+
+import httpx
+import orjson
+import polars as pl
+import pytest
+import shapely
+from prefect.cache_policies import NO_CACHE
+
+from pipelines.extract import de_wasserportal
+from pipelines.extract.de_wasserportal import (
+    collect_water_companies,
+    download_de_wasserportal,
+)
+
+
+def _company(name: str) -> dict:
+    return {
+        "Name": name,
+        "Phone": "030 123",
+        "Email": f"info@{name.lower()}.de",
+        "Website": f"https://{name.lower()}.de",
+        "Description": f"{name} description",
+    }
+
+
+class TestWasserportalClient:
+
+    @pytest.fixture(autouse=True)
+    def _reset_client(self):
+        de_wasserportal._CLIENT = None
+        yield
+        de_wasserportal._CLIENT = None
+
+    def test_created_once_on_first_use(self):
+        with (
+            patch(f"{de_wasserportal.__name__}.httpx.Client") as MockClient,
+            patch(f"{de_wasserportal.__name__}.atexit.register") as mock_register,
+        ):
+            client = de_wasserportal.wasserportal_client()
+            assert de_wasserportal.wasserportal_client() is client
+        MockClient.assert_called_once()
+        assert MockClient.call_args.kwargs["http2"] is True
+        mock_register.assert_called_once_with(client.close)
+
+    def test_created_once_by_concurrent_lookups(self):
+        def slow_client(**kwargs):
+            # Widen the window in which another thread could create a second client
+            time.sleep(0.05)
+            return Mock()
+
+        with (
+            patch(
+                f"{de_wasserportal.__name__}.httpx.Client", side_effect=slow_client
+            ) as MockClient,
+            patch(f"{de_wasserportal.__name__}.atexit.register") as mock_register,
+            ThreadPoolExecutor(max_workers=8) as executor,
+        ):
+            futures = [
+                executor.submit(de_wasserportal.wasserportal_client) for _ in range(8)
+            ]
+            clients = {id(future.result()) for future in futures}
+        assert len(clients) == 1
+        MockClient.assert_called_once()
+        mock_register.assert_called_once()
+
+
+class TestCollectWaterCompanies:
+
+    def test_pairs_results_in_order(self):
+        companies = collect_water_companies(
+            ["A", "B", "C"], [_company("X"), _company("Y"), _company("X")]
+        )
+        assert [(c["Name"], c["Municipality"]) for c in companies] == [
+            ("X", "A"),
+            ("Y", "B"),
+            ("X", "C"),
+        ]
+
+    def test_skips_missing_and_failed_lookups(self):
+        error = httpx.HTTPStatusError(
+            "Server error", request=None, response=None  # type: ignore[arg-type]
+        )
+        companies = collect_water_companies(
+            ["A", "B", "C"], [None, error, _company("X")]
+        )
+        assert companies == [{**_company("X"), "Municipality": "C"}]
+
+
+class TestGetExistingDeMunicipalities:
+
+    def _write_municipalities(self, data_directory, rows):
+        (data_directory / "staging").mkdir()
+        (data_directory / "staging" / "Municipality.ndjson").write_bytes(
+            b"\n".join(orjson.dumps(row) for row in rows)
+        )
+
+    def test_reduces_geometries_to_rounded_centroids(self, tmp_path):
+        triangle = shapely.Polygon([(0, 0), (1, 0), (0, 1)])
+        self._write_municipalities(
+            tmp_path,
+            [
+                {
+                    "Code": "DE001",
+                    "Name": "Triangle",
+                    "CountryCode": "DE",
+                    "Geometry": shapely.to_geojson(triangle),
+                },
+                {
+                    "Code": "DE002",
+                    "Name": "Square",
+                    "CountryCode": "DE",
+                    "Geometry": shapely.to_geojson(shapely.box(13, 52, 14, 53)),
+                },
+                {
+                    "Code": "FR001",
+                    "Name": "Other country",
+                    "CountryCode": "FR",
+                    "Geometry": shapely.to_geojson(shapely.box(2, 48, 3, 49)),
+                },
+            ],
+        )
+
+        df = de_wasserportal.get_existing_de_municipalities_task.fn("DE", tmp_path)
+
+        assert df.columns == ["Code", "Name", "Latitude", "Longitude"]
+        assert df["Code"].to_list() == ["DE001", "DE002"]
+        # the triangle centroid (1/3, 1/3) is rounded to 6 decimals
+        assert df["Latitude"].to_list() == [0.333333, 52.5]
+        assert df["Longitude"].to_list() == [0.333333, 13.5]
+
+    def test_skips_missing_and_empty_geometries(self, tmp_path):
+        self._write_municipalities(
+            tmp_path,
+            [
+                {
+                    "Code": "DE001",
+                    "Name": "Null",
+                    "CountryCode": "DE",
+                    "Geometry": None,
+                },
+                {
+                    "Code": "DE002",
+                    "Name": "Empty",
+                    "CountryCode": "DE",
+                    "Geometry": '{"type":"Polygon","coordinates":[]}',
+                },
+                {
+                    "Code": "DE003",
+                    "Name": "Invalid",
+                    "CountryCode": "DE",
+                    "Geometry": "",
+                },
+                {
+                    "Code": "DE004",
+                    "Name": "Square",
+                    "CountryCode": "DE",
+                    "Geometry": shapely.to_geojson(shapely.box(13, 52, 14, 53)),
+                },
+            ],
+        )
+
+        df = de_wasserportal.get_existing_de_municipalities_task.fn("DE", tmp_path)
+
+        assert df.rows() == [("DE004", "Square", 52.5, 13.5)]
+
+
+# Each municipality is a 1° square, so its centroid latitude is y + 0.5
+MUNICIPALITIES = {
+    "DE001": (0, _company("Berlin Water")),  # served
+    "DE002": (1, None),  # no company: 204
+    "DE003": (2, "error"),  # failed lookup: 500
+    "DE004": (3, _company("Berlin Water")),  # served by the same company
+    "DE005": (4, _company("Hamburg Water")),
+}
+
+
+def _handle_request(request: httpx.Request) -> httpx.Response:
+    latitude = float(request.url.params["latitude"])
+    code, (y, company) = next(
+        (code, value)
+        for code, value in MUNICIPALITIES.items()
+        if value[0] + 0.5 == latitude
+    )
+    # Answer the first lookups last, so completion order differs from input order
+    time.sleep(0.05 * (len(MUNICIPALITIES) - y))
+    if company is None:
+        return httpx.Response(204)
+    if company == "error":
+        return httpx.Response(500)
+    return httpx.Response(
+        200,
+        json={
+            "versorger": {
+                "bezeichnung": company["Name"],
+                "telefonBuero": company["Phone"],
+                "email": company["Email"],
+                "www": company["Website"],
+                "beschreibung": company["Description"],
+            }
+        },
+    )
+
+
+@pytest.fixture
+def data_directory(tmp_path):
+    (tmp_path / "staging").mkdir()
+    (tmp_path / "raw").mkdir()
+    rows = [
+        {
+            "Code": code,
+            "Name": f"Municipality {code}",
+            "CountryCode": "DE",
+            "Geometry": shapely.to_geojson(shapely.box(10, y, 11, y + 1)),
+        }
+        for code, (y, _) in MUNICIPALITIES.items()
+    ]
+    rows.append({**rows[0], "Code": "FR001", "CountryCode": "FR"})
+    (tmp_path / "staging" / "Municipality.ndjson").write_bytes(
+        b"\n".join(orjson.dumps(row) for row in rows)
+    )
+    return tmp_path
+
+
+@pytest.mark.usefixtures("prefect_harness")
+class TestDownloadDeWasserportal:
+
+    def test_writes_companies_of_served_municipalities(self, data_directory):
+        client = httpx.Client(transport=httpx.MockTransport(_handle_request))
+        module = "pipelines.extract.de_wasserportal"
+        with (
+            patch(f"{module}.wasserportal_client", return_value=client),
+            patch(f"{module}.rate_limit"),
+            # Do not read or write lookups cached by other runs
+            patch(
+                f"{module}.get_water_company",
+                de_wasserportal.get_water_company.with_options(
+                    cache_policy=NO_CACHE, persist_result=False
+                ),
+            ),
+        ):
+            download_de_wasserportal(data_directory)
+
+        result = pl.read_ndjson(
+            data_directory / "raw" / "WaterCompany_de_wasserportal.ndjson"
+        ).sort("Name")
+        assert result["Name"].to_list() == ["Berlin Water", "Hamburg Water"]
+        # Municipalities keep their input order, whatever order lookups complete in
+        assert result["Municipalities"].to_list() == [["DE001", "DE004"], ["DE005"]]
+        assert result["Email"].to_list() == [
+            "info@berlin water.de",
+            "info@hamburg water.de",
+        ]
+        assert set(result["Source"]) == {"WasserPortal"}
+        assert set(result["CountryCode"]) == {"DE"}
@@ -0,0 +1,94 @@
+"""Tests for download_municipalities workflow."""
+
+import json
+from unittest.mock import patch
+
+import pytest
+
+pyogrio = pytest.importorskip("pyogrio")
+gpd = pytest.importorskip("geopandas")
+shapely = pytest.importorskip("shapely")
+
+from pipelines.extract.download_municipalities import convert_gpkg_to_geojson  # noqa: E402
+
+
+@pytest.fixture
+def gpkg_file(tmp_path):
+    """Small commune GPKG in the source projection (EPSG:3035)."""
+    gdf = gpd.GeoDataFrame(
+        {
+            "COMM_ID": [f"C{i}" for i in range(5)],
+            "CNTR_CODE": ["UK", "FR", "UK", "DE", "FR"],
+        },
+        geometry=[
+            shapely.box(4e6 + i * 1000, 3e6, 4e6 + i * 1000 + 500, 3e6 + 500)
+            for i in range(5)
+        ],
+        crs="EPSG:3035",
+    )
+    path = tmp_path / "communes.gpkg"
+    pyogrio.write_dataframe(gdf, path)
+    return path
+
+
+class TestConvertGpkgToGeojson:
+
+    def test_converts_in_chunks(self, gpkg_file, tmp_path):
+        """Every chunk is appended, reprojected, with UK replaced by GB."""
+        output_path = tmp_path / "municipalities.geojson"
+
+        with patch(
+            "pipelines.extract.download_municipalities.CONVERT_CHUNK_SIZE", 2
+        ):
+            result = convert_gpkg_to_geojson.fn(gpkg_file, output_path)
+
+        assert result == output_path
+        assert not output_path.with_suffix(".tmp.geojson").exists()
+        geojson = json.loads(output_path.read_text())
+        assert geojson["type"] == "FeatureCollection"
+        features = geojson["features"]
+        assert [f["properties"]["COMM_ID"] for f in features] == [
+            "C0", "C1", "C2", "C3", "C4"
+        ]
+        assert [f["properties"]["CNTR_CODE"] for f in features] == [
+            "GB", "FR", "GB", "DE", "FR"
+        ]
+        expected = pyogrio.read_dataframe(gpkg_file).to_crs(epsg=4326)
+        for feature, geometry in zip(features, expected.geometry):
+            converted = shapely.geometry.shape(feature["geometry"])
+            assert converted.equals_exact(geometry, tolerance=1e-9)
+
+    @pytest.mark.parametrize("chunk_size", [2, 5])
+    def test_unknown_feature_count(self, gpkg_file, tmp_path, chunk_size):
+        """Without a feature count, chunks are read until one comes back short."""
+        output_path = tmp_path / "municipalities.geojson"
+        module = "pipelines.extract.download_municipalities"
+
+        with (
+            patch(f"{module}.CONVERT_CHUNK_SIZE", chunk_size),
+            patch(f"{module}.pyogrio.read_info", return_value={"features": -1}),
+        ):
+            convert_gpkg_to_geojson.fn(gpkg_file, output_path)
+
+        features = json.loads(output_path.read_text())["features"]
+        assert [f["properties"]["COMM_ID"] for f in features] == [
+            "C0", "C1", "C2", "C3", "C4"
+        ]
+
+    def test_empty_source(self, tmp_path):
+        gpkg_file = tmp_path / "communes.gpkg"
+        empty = gpd.GeoDataFrame({"COMM_ID": []}, geometry=[], crs="EPSG:3035")
+        pyogrio.write_dataframe(empty, gpkg_file)
+        output_path = tmp_path / "municipalities.geojson"
+
+        convert_gpkg_to_geojson.fn(gpkg_file, output_path)
+
+        assert json.loads(output_path.read_text())["features"] == []
+
+    def test_existing_output_is_kept(self, gpkg_file, tmp_path):
+        output_path = tmp_path / "municipalities.geojson"
+        output_path.write_text("{}")
+
+        convert_gpkg_to_geojson.fn(gpkg_file, output_path)
+
+        assert output_path.read_text() == "{}"
@@ -27,11 +27,29 @@ from pipelines.common import services
 from pipelines.common.db_helper import DatabaseHelper
 
 
+# Expected input fields (see above); other fields of the staging files are not read
+WATER_COMPANY_SCHEMA = {
+    "CountryCode": pl.Utf8,
+    "Name": pl.Utf8,
+    "Phone": pl.Utf8,
+    "Email": pl.Utf8,
+    "Website": pl.Utf8,
+    "Description": pl.Utf8,
+    "Source": pl.Utf8,
+}
+
+
 @task(name="load_water_companies", cache_policy=NO_CACHE)
 def load_water_companies_task(data_path: Path) -> pl.DataFrame:
-    """Load water companies from CSV file"""
-    return pl.read_ndjson(data_path / "WaterCompany*.ndjson").with_columns(
-        pl.lit("Water Company").alias("Type")
+    """Load water companies from the staging NDJSON files.
+
+    The schema is given explicitly, so no type inference pass is needed and optional
+    fields missing from a source come back as nulls.
+    """
+    return (
+        pl.scan_ndjson(data_path / "WaterCompany*.ndjson", schema=WATER_COMPANY_SCHEMA)
+        .with_columns(pl.lit("Water Company").alias("Type"))
+        .collect()
     )
 
 
@@ -75,15 +93,24 @@ def insert_actors_task(df: pl.DataFrame, db_helper: DatabaseHelper) -> pl.DataFr
     existing_df = db_helper.load_all_records(
         table_name="Actor", fields=["Name", "Id"], condition={"Type": "Water Company"}
     )
-    df = df.join(existing_df, on="Name", how="left")
-    insert_df = df.filter(pl.col("Id").is_null()).select(
+    df = df.join(existing_df, on="Name", how="left").with_row_index("row_nr")
+    new_df = df.filter(pl.col("Id").is_null())
+    insert_df = new_df.select(
         "Name", "Country_id", "Phone", "Email", "Website", "Description", "Source"
     )
     logger.info(f"Inserting {len(insert_df)} actors into the database")
     inserted_df = db_helper.insert_records(insert_df, table_name="Actor")
     # join the inserted actors back to the original dataframe, so we have the Id column
-    df = df.with_columns(inserted_df["Id"])
-    return df
+    # (inserted ids come back in insert order, matched on the row number since names
+    # are not guaranteed to be unique)
+    inserted_ids = new_df.select("row_nr").with_columns(
+        inserted_df["Id"].alias("Inserted_id")
+    )
+    return (
+        df.join(inserted_ids, on="row_nr", how="left")
+        .with_columns(pl.coalesce("Id", "Inserted_id").alias("Id"))
+        .drop("row_nr", "Inserted_id")
+    )
 
 
 @task(name="link_actors_to_distribution_zones", cache_policy=NO_CACHE)
@@ -18,12 +18,12 @@ from dataclasses import dataclass, field
 from pathlib import Path
 import polars as pl
 from prefect import flow, get_run_logger, task
-from prefect.cache_policies import INPUTS, NO_CACHE
+from prefect.cache_policies import NO_CACHE
 
 from pipelines.common import services
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class LevelConfig:
     table_name: str
     parent_level: str | None = None
@@ -78,7 +78,7 @@ def filter_existing_data(df: pl.DataFrame, table_name: str) -> pl.DataFrame:
     return df.join(existing_df, on="Code", how="anti")
 
 
-@task(name="lookup_parent", cache_policy=INPUTS)
+@task(name="lookup_parent", cache_policy=NO_CACHE)
 def lookup_parent_task(df: pl.DataFrame, level_config: LevelConfig) -> pl.DataFrame:
     """
     Lookup the parent data for the given level.
@@ -119,7 +119,7 @@ def insert_records_task(df: pl.DataFrame, table_name: str) -> pl.DataFrame:
     return df
 
 
-@task(name="lookup_children", cache_policy=INPUTS)
+@task(name="lookup_children", cache_policy=NO_CACHE)
 def lookup_children_task(
     df: pl.DataFrame, child_level: str, child_field_name: str
 ) -> pl.DataFrame:
@@ -159,7 +159,7 @@ def lookup_children_task(
     )
 
 
-@task(name="link_children", cache_policy=INPUTS)
+@task(name="link_children", cache_policy=NO_CACHE)
 def link_children_task(
     df: pl.DataFrame, child_field_name: str, table_name: str
 ) -> None:
@@ -206,10 +206,17 @@ def load_zones_flow(level: str, data_directory: Path) -> None:
     df = filter_existing_data(df_source, level_config.table_name)
     df = lookup_parent_task(df, level_config)
     df = insert_records_task(df, level_config.table_name)
-    if level_config.child_level:
-        for child_level, child_field_name in level_config.child_level.items():
-            df_links = lookup_children_task(df, child_level, child_field_name)
-            link_children_task(df_links, child_field_name, level_config.table_name)
+    # each child level is independent, so look them up and link them concurrently
+    link_futures = [
+        link_children_task.submit(
+            lookup_children_task.submit(df, child_level, child_field_name),
+            child_field_name,
+            level_config.table_name,
+        )
+        for child_level, child_field_name in level_config.child_level.items()
+    ]
+    for link_future in link_futures:
+        link_future.result()
 
 
 if __name__ == "__main__":
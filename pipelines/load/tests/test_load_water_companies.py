@@ -0,0 +1,77 @@
+"""Tests for load_water_companies workflow."""
+
+from unittest.mock import Mock
+
+import polars as pl
+
+from pipelines.load.load_water_companies import insert_actors_task
+
+
+class TestInsertActors:
+
+    def test_assigns_existing_and_inserted_ids(self):
+        """New actors get the inserted Ids in order, existing ones keep theirs."""
+        df = pl.DataFrame(
+            {
+                "Name": ["New A", "Existing", "Twin", "New B", "Twin"],
+                "Country_id": [1, 1, 2, 2, 3],
+                "Phone": ["a", "e", "t1", "b", "t2"],
+                "Email": [None] * 5,
+                "Website": [None] * 5,
+                "Description": [None] * 5,
+                "Source": ["test"] * 5,
+            },
+            schema_overrides={
+                "Email": pl.Utf8,
+                "Website": pl.Utf8,
+                "Description": pl.Utf8,
+            },
+        )
+        db_helper = Mock()
+        db_helper.load_all_records.return_value = pl.DataFrame(
+            {"Name": ["Existing"], "Id": [7]}
+        )
+        # insert_records returns the inserted rows, in order, with their new Id
+        db_helper.insert_records.side_effect = lambda insert_df, table_name: (
+            insert_df.with_columns(pl.Series("Id", range(100, 100 + len(insert_df))))
+        )
+
+        result = insert_actors_task.fn(df, db_helper)
+
+        inserted = db_helper.insert_records.call_args[0][0]
+        assert inserted["Phone"].to_list() == ["a", "t1", "b", "t2"]
+        assert result.select("Name", "Phone", "Id").rows() == [
+            ("New A", "a", 100),
+            ("Existing", "e", 7),
+            ("Twin", "t1", 101),
+            ("New B", "b", 102),
+            ("Twin", "t2", 103),
+        ]
+        assert "row_nr" not in result.columns
+
+    def test_only_existing_actors(self):
+        df = pl.DataFrame(
+            {
+                "Name": ["Existing"],
+                "Country_id": [1],
+                "Phone": [None],
+                "Email": [None],
+                "Website": [None],
+                "Description": [None],
+                "Source": ["test"],
+            },
+            schema_overrides={
+                column: pl.Utf8 for column in ["Phone", "Email", "Website", "Description"]
+            },
+        )
+        db_helper = Mock()
+        db_helper.load_all_records.return_value = pl.DataFrame(
+            {"Name": ["Existing"], "Id": [7]}
+        )
+        db_helper.insert_records.side_effect = lambda insert_df, table_name: (
+            insert_df.with_columns(pl.Series("Id", [], dtype=pl.Int64))
+        )
+
+        result = insert_actors_task.fn(df, db_helper)
+
+        assert result["Id"].to_list() == [7]
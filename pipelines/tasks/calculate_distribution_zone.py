@@ -3,14 +3,17 @@ Prefect workflow for calculating the geometry of distribution zones that are mis
 covered municipalities.
 """
 
-import json
+import numpy as np
 from prefect import flow, get_run_logger, task
 from prefect.cache_policies import NO_CACHE
-from shapely import unary_union
-from shapely.geometry import shape
+import shapely
 from pipelines.common import services
 import polars as pl
 
+# Zones per merge task; slices are merged in parallel by the flow's task runner (GEOS
+# releases the GIL, so threads do run the unions concurrently)
+MERGE_CHUNK_SIZE = 100
+
 
 @task(name="merge_municipalities_geometries", cache_policy=NO_CACHE)
 def merge_municipalities_geometries_task(
@@ -20,18 +23,31 @@ def merge_municipalities_geometries_task(
     Merge the geometries of the municipalities into a single geometry for each water company.
     Return water_companies_df with an additional column "Geometry" containing the merged geometry.
     """
-    geometries = []
-    for row in water_companies_df.iter_rows(named=True):
-        # Extract all geometries from municipalities
-        muni_geometries = row["Municipality Geometries"]
-        if muni_geometries:
-            muni_geometries = [shape(json.loads(muni)) for muni in muni_geometries]
-            merged_geometry = unary_union(muni_geometries)
-            geometries.append(json.dumps(merged_geometry.__geo_interface__))
-        else:
-            geometries.append(None)
+    if not isinstance(water_companies_df["Municipality Geometries"].dtype, pl.List):
+        # No zone has any municipality geometry: the column is all nulls (Utf8 when
+        # NocoDB left the field out of every record, Null when every value is None)
+        return water_companies_df.with_columns(
+            pl.lit(None, dtype=pl.Utf8).alias("Geometry")
+        )
+    muni_geometries = water_companies_df["Municipality Geometries"].list.drop_nulls()
+    counts = muni_geometries.list.len().fill_null(0).to_numpy()
+    ends = np.cumsum(counts)
+    starts = ends - counts
+    # Parse the geometries of all the municipalities at once, in GEOS, then union
+    # each water company's slice of them
+    parsed = shapely.from_geojson(muni_geometries.explode().drop_nulls().to_numpy())
+    merged = np.array(
+        [
+            shapely.union_all(parsed[start:end]) if end > start else None
+            for start, end in zip(starts, ends)
+        ],
+        dtype=object,
+    )
     return water_companies_df.with_columns(
-        pl.Series(name="Geometry", values=geometries)
+        # tolist(): Polars cannot build a Utf8 Series from an object array
+        pl.Series(
+            name="Geometry", values=shapely.to_geojson(merged).tolist(), dtype=pl.Utf8
+        )
     )
 
 
@@ -58,8 +74,12 @@ def calculate_distribution_zone_flow():
     )
     # Filter to only zones missing geometry (replaces the "Missing Geometries" view)
     df = df.filter(pl.col("Geometry").is_null())
-    df = merge_municipalities_geometries_task(df)
-    df = df.filter(pl.col("Geometry").is_not_null())
+    if df.is_empty():
+        return
+    merged = merge_municipalities_geometries_task.map(
+        list(df.iter_slices(MERGE_CHUNK_SIZE))
+    ).result()
+    df = pl.concat(merged).filter(pl.col("Geometry").is_not_null())
     update_distribution_zone_task(df, db_helper)
 
 
@@ -1,4 +1,3 @@
-import polars as pl
 from pipelines.common import services
 from prefect import flow
 
@@ -9,11 +8,12 @@ def clean_actors_flow():
     Delete actors that have a blank name.
     """
     db_helper = services.db_helper()
+    # Filtered by NocoDB, so only the blank actors are fetched
     df = db_helper.load_all_records(
         table_name="Actor",
         fields=["Name", "Id"],
+        condition={"Name": None},
     )
-    df = df.filter(pl.col("Name").is_null())
     db_helper.delete_records(df, table_name="Actor")
     return df
 
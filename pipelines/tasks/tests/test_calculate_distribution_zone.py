@@ -0,0 +1,131 @@
+"""Tests for calculate_distribution_zone workflow."""
+
+import json
+from unittest.mock import patch
+
+import polars as pl
+import pytest
+import shapely
+
+from pipelines.tasks.calculate_distribution_zone import (
+    calculate_distribution_zone_flow,
+    merge_municipalities_geometries_task,
+)
+
+
+def _square(x: float) -> str:
+    return json.dumps(
+        {
+            "type": "Polygon",
+            "coordinates": [[[x, 0], [x + 1, 0], [x + 1, 1], [x, 1], [x, 0]]],
+        }
+    )
+
+
+class TestMergeMunicipalitiesGeometries:
+
+    def test_merges_each_zone_slice(self):
+        """Offsets map each zone to its own municipalities, whatever surrounds them."""
+        df = pl.DataFrame(
+            {
+                "Id": [1, 2, 3, 4, 5],
+                "Municipality Geometries": [
+                    [],
+                    [_square(0), _square(1)],
+                    None,
+                    [_square(5), None],
+                    [],
+                ],
+            }
+        )
+
+        result = merge_municipalities_geometries_task.fn(df)
+
+        assert result["Id"].to_list() == [1, 2, 3, 4, 5]
+        geometries = result["Geometry"].to_list()
+        assert geometries[0] is None
+        assert geometries[2] is None
+        assert geometries[4] is None
+        assert shapely.from_geojson(geometries[1]).equals(shapely.box(0, 0, 2, 1))
+        assert shapely.from_geojson(geometries[3]).equals(shapely.box(5, 0, 6, 1))
+
+    def test_leading_null_list(self):
+        df = pl.DataFrame({"Id": [1, 2], "Municipality Geometries": [None, [_square(0)]]})
+
+        result = merge_municipalities_geometries_task.fn(df)
+
+        assert result["Geometry"].dtype == pl.Utf8
+        assert result["Geometry"][0] is None
+        assert shapely.from_geojson(result["Geometry"][1]).equals(shapely.box(0, 0, 1, 1))
+
+    def test_no_municipalities(self):
+        df = pl.DataFrame(
+            {"Id": [1, 2], "Municipality Geometries": [[], []]},
+            schema={"Id": pl.Int64, "Municipality Geometries": pl.List(pl.Utf8)},
+        )
+
+        result = merge_municipalities_geometries_task.fn(df)
+
+        assert result["Geometry"].dtype == pl.Utf8
+        assert result["Geometry"].to_list() == [None, None]
+
+    def test_field_missing_from_every_record(self):
+        """The loader adds a field NocoDB left out of every record as a null Utf8 column."""
+        df = pl.DataFrame({"Id": [1, 2]}).with_columns(
+            pl.lit(None, dtype=pl.Utf8).alias("Municipality Geometries")
+        )
+
+        result = merge_municipalities_geometries_task.fn(df)
+
+        assert result["Geometry"].dtype == pl.Utf8
+        assert result["Geometry"].to_list() == [None, None]
+
+    def test_all_null_municipalities(self):
+        """Records whose field is None in every row are inferred as a Null column."""
+        df = pl.DataFrame(
+            [
+                {"Id": 1, "Municipality Geometries": None},
+                {"Id": 2, "Municipality Geometries": None},
+            ],
+            infer_schema_length=None,
+        )
+
+        result = merge_municipalities_geometries_task.fn(df)
+
+        assert result["Geometry"].dtype == pl.Utf8
+        assert result["Geometry"].to_list() == [None, None]
+
+
+@pytest.mark.usefixtures("prefect_harness")
+class TestCalculateDistributionZoneFlow:
+
+    def test_updates_zones_of_every_slice(self):
+        """Slices are merged in parallel, and every zone with a geometry is updated."""
+        ids = list(range(1, 11))
+        df = pl.DataFrame(
+            {
+                "Id": ids,
+                "Geometry": [None] * 9 + ['{"type":"Point","coordinates":[0,0]}'],
+                # every slice of 3 zones starts with a zone without municipalities
+                "Municipality Geometries": [
+                    [] if i % 3 == 1 else [_square(i)] for i in ids
+                ],
+            },
+            schema_overrides={"Geometry": pl.Utf8},
+        )
+
+        module = "pipelines.tasks.calculate_distribution_zone"
+        with (
+            patch(f"{module}.MERGE_CHUNK_SIZE", 3),
+            patch(f"{module}.services.db_helper") as db,
+        ):
+            db.return_value.load_all_records.return_value = df
+            calculate_distribution_zone_flow()
+
+        db.return_value.update_records.assert_called_once()
+        updated = db.return_value.update_records.call_args[0][0]
+        # zone 10 already has a geometry, zones 1, 4 and 7 have no municipalities
+        assert updated["Id"].to_list() == [2, 3, 5, 6, 8, 9]
+        for zone_id, geometry in updated.select("Id", "Geometry").iter_rows():
+            expected = shapely.box(zone_id, 0, zone_id + 1, 1)
+            assert shapely.from_geojson(geometry).equals(expected)
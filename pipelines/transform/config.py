@@ -4,7 +4,7 @@ from typing import Dict
 from dataclasses import dataclass
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class LevelConfig:
     """Configuration for a geographic level."""
 
@@ -99,3 +99,6 @@ EUROPEAN_COUNTRIES = {
 #     "GB": "United Kingdom",
 #     "VA": "Vatican City",
 # }
+
+# Codes of EUROPEAN_COUNTRIES, for membership tests
+EUROPEAN_COUNTRY_CODES: frozenset[str] = frozenset(EUROPEAN_COUNTRIES)
@@ -38,7 +38,12 @@ def create_distribution_zones_flow(data_directory: Path):
     """
     Create distribution zones based on water companies and municipalities.
     """
-    water_companies_df = pl.read_ndjson(data_directory / "raw" / "WaterCompany*.ndjson")
+    # Only the columns used by the task are parsed from the (possibly large) files
+    water_companies_df = (
+        pl.scan_ndjson(data_directory / "raw" / "WaterCompany*.ndjson")
+        .select("Name", "CountryCode", "Municipalities")
+        .collect()
+    )
     distribution_zones_df = create_distribution_zones_task(water_companies_df)
     distribution_zones_df.write_ndjson(
         data_directory / "staging" / "DistributionZone_from_water_companies.ndjson"
@@ -2,18 +2,34 @@
 Prefect workflow for transforming GeoJSON data into the zone objects (Country + Municipality)
 """
 
-import json
 from pathlib import Path
+from typing import Collection
+import orjson
 import polars as pl
 from prefect import flow, get_run_logger, task
 from prefect.cache_policies import NO_CACHE
 
-from pipelines.transform.config import LEVEL_CONFIGS, LevelConfig, EUROPEAN_COUNTRIES
+from pipelines.transform.config import LEVEL_CONFIGS, LevelConfig, EUROPEAN_COUNTRY_CODES
+
+
+def _text_property(properties: dict, name: str, default: str | None) -> str | None:
+    """
+    Get a feature property as text: numbers (e.g. numeric codes) are converted,
+    other non-string values are rejected instead of being silently dropped.
+    """
+    value = properties.get(name, default)
+    if value is None or isinstance(value, str):
+        return value
+    if isinstance(value, (int, float)) and not isinstance(value, bool):
+        return str(value)
+    raise ValueError(f"Property {name!r} must be a string or a number, got {value!r}")
 
 
 @task(name="transform_geojson", cache_policy=NO_CACHE)
 def transform_geojson_task(
-    geojson_file_path: Path, level_config: LevelConfig
+    geojson_file_path: Path,
+    level_config: LevelConfig,
+    country_codes: Collection[str] | None = None,
 ) -> pl.DataFrame:
     """
     Transform GeoJSON data into a Polars DataFrame.
@@ -21,13 +37,15 @@ def transform_geojson_task(
     Args:
         geojson_file_path: Path to the GeoJSON file
         level_config: Configuration for the current level
+        country_codes: Optional country codes to keep; features of other countries
+            (their own code for the top level, else their parent code) are skipped
+            before their geometry is serialized
 
     Returns:
         Polars DataFrame with Name, Code, Geometry, and ParentCode columns
     """
-    # Read GeoJSON file
-    with open(geojson_file_path, "r") as f:
-        geojson_data = json.load(f)
+    # Read GeoJSON file, parsed from its bytes with orjson (no str copy of the file)
+    geojson_data = orjson.loads(geojson_file_path.read_bytes())
 
     # Validate it's a FeatureCollection
     if geojson_data.get("type") != "FeatureCollection":
@@ -35,32 +53,51 @@ def transform_geojson_task(
 
     features = geojson_data.get("features", [])
 
-    # Extract data from each feature
-    rows = []
+    # Config lookups are bound once, outside the per-feature loop
+    title_property = level_config.title_property
+    code_property = level_config.code_property
+    parent_level = level_config.parent_level
+    parent_property = level_config.parent_property
+
+    # Extract data from each feature, one list per column
+    names, codes, geometries, parent_codes = [], [], [], []
     for feature in features:
         properties = feature.get("properties", {})
-        geometry = feature.get("geometry", {})
 
         # Map properties according to configuration
-        title = properties.get(level_config.title_property, "")
-        code = properties.get(level_config.code_property, "")
+        code = _text_property(properties, code_property, "")
 
         # Get parent code if parent level exists
         parent_code = None
-        if level_config.parent_level:
-            parent_code_property = level_config.parent_property
-            parent_code = properties.get(parent_code_property)
-
-        rows.append(
-            {
-                "Name": title,
-                "Code": code,
-                "Geometry": json.dumps(geometry),  # Store geometry as JSON string
-                "ParentCode": parent_code,
-            }
-        )
-
-    return pl.DataFrame(rows)
+        if parent_level:
+            parent_code = _text_property(properties, parent_property, None)
+
+        country_code = parent_code if parent_level else code
+        if country_codes is not None and country_code not in country_codes:
+            continue
+
+        names.append(_text_property(properties, title_property, ""))
+        codes.append(code)
+        parent_codes.append(parent_code)
+        # Store geometry as JSON string (orjson encodes coordinate arrays in C)
+        geometries.append(orjson.dumps(feature.get("geometry", {})).decode())
+
+    # Explicit schema: no inference pass, and every column is a string column even
+    # when a file has no parent codes at all (values were converted above)
+    return pl.DataFrame(
+        {
+            "Name": names,
+            "Code": codes,
+            "Geometry": geometries,
+            "ParentCode": parent_codes,
+        },
+        schema={
+            "Name": pl.Utf8,
+            "Code": pl.Utf8,
+            "Geometry": pl.Utf8,
+            "ParentCode": pl.Utf8,
+        },
+    )
 
 
 @task(name="lookup_country", cache_policy=NO_CACHE)
@@ -97,10 +134,13 @@ def import_geojson_flow(level: str, source_dir: Path, dest_dir: Path) -> None:
     if not geojson_files:
         raise FileNotFoundError(f"No GeoJSON file found matching pattern: {pattern}")
 
+    # Only European countries are kept, skipped while reading the features
     transformed_df = pl.concat(
         [
             transform_geojson_task(
-                geojson_file_path=geojson_file, level_config=level_config
+                geojson_file_path=geojson_file,
+                level_config=level_config,
+                country_codes=EUROPEAN_COUNTRY_CODES,
             )
             for geojson_file in geojson_files
         ]
@@ -108,13 +148,6 @@ def import_geojson_flow(level: str, source_dir: Path, dest_dir: Path) -> None:
     if level != "Country":
         # get CountryCode
         transformed_df = lookup_country_task(transformed_df)
-        transformed_df = transformed_df.filter(
-            pl.col("CountryCode").is_in(EUROPEAN_COUNTRIES.keys())
-        )
-    else:
-        transformed_df = transformed_df.filter(
-            pl.col("Code").is_in(EUROPEAN_COUNTRIES.keys())
-        )
 
     transformed_df.write_ndjson(dest_dir / f"{level}.ndjson")
 
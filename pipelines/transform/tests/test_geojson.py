@@ -0,0 +1,162 @@
+"""Tests for the GeoJSON transform workflow."""
+
+import orjson
+import polars as pl
+import pytest
+
+from pipelines.transform.config import EUROPEAN_COUNTRY_CODES, LEVEL_CONFIGS
+from pipelines.transform.geojson import (
+    import_geojson_flow,
+    lookup_country_task,
+    transform_geojson_task,
+)
+
+TRIANGLE = {
+    "type": "Polygon",
+    "coordinates": [[[0.5, 0.0], [1.0, 0.0], [1.0, 1.25], [0.5, 0.0]]],
+}
+
+
+def _write_geojson(path, features, collection_type="FeatureCollection"):
+    path.write_bytes(orjson.dumps({"type": collection_type, "features": features}))
+    return path
+
+
+def _feature(properties, geometry=TRIANGLE):
+    return {"type": "Feature", "properties": properties, "geometry": geometry}
+
+
+class TestTransformGeojson:
+
+    def test_maps_properties_of_the_level(self, tmp_path):
+        geojson_file = _write_geojson(
+            tmp_path / "municipalities.geojson",
+            [
+                _feature({"COMM_NAME": "Zürich", "COMM_ID": "CH1", "CNTR_CODE": "CH"}),
+                _feature({"COMM_NAME": "Lyon", "COMM_ID": "FR1", "CNTR_CODE": "FR"}),
+            ],
+        )
+
+        df = transform_geojson_task.fn(geojson_file, LEVEL_CONFIGS["Municipality"])
+
+        assert df.schema == {
+            "Name": pl.Utf8,
+            "Code": pl.Utf8,
+            "Geometry": pl.Utf8,
+            "ParentCode": pl.Utf8,
+        }
+        assert df.select("Name", "Code", "ParentCode").rows() == [
+            ("Zürich", "CH1", "CH"),
+            ("Lyon", "FR1", "FR"),
+        ]
+
+    def test_serializes_geometries_as_json(self, tmp_path):
+        geojson_file = _write_geojson(
+            tmp_path / "countries.geojson",
+            [
+                _feature({"name": "France", "ISO3166-1-Alpha-2": "FR"}),
+                {"type": "Feature", "properties": {"name": "No geometry"}},
+            ],
+        )
+
+        df = transform_geojson_task.fn(geojson_file, LEVEL_CONFIGS["Country"])
+
+        assert orjson.loads(df["Geometry"][0]) == TRIANGLE
+        assert df["Geometry"][1] == "{}"
+        # missing properties fall back to empty strings, top level has no parent
+        assert df.select("Name", "Code", "ParentCode").rows() == [
+            ("France", "FR", None),
+            ("No geometry", "", None),
+        ]
+
+    def test_converts_numeric_codes_to_strings(self, tmp_path):
+        geojson_file = _write_geojson(
+            tmp_path / "municipalities.geojson",
+            [
+                _feature({"COMM_NAME": "A", "COMM_ID": 1234, "CNTR_CODE": "DE"}),
+                _feature({"COMM_NAME": "B", "COMM_ID": "DE5678", "CNTR_CODE": None}),
+            ],
+        )
+
+        df = transform_geojson_task.fn(geojson_file, LEVEL_CONFIGS["Municipality"])
+
+        assert df["Code"].to_list() == ["1234", "DE5678"]
+        assert df["ParentCode"].to_list() == ["DE", None]
+
+    @pytest.mark.parametrize("value", [{"id": 1}, ["FR", "DE"], True])
+    def test_rejects_non_text_properties(self, tmp_path, value):
+        geojson_file = _write_geojson(
+            tmp_path / "countries.geojson",
+            [_feature({"name": "France", "ISO3166-1-Alpha-2": value})],
+        )
+
+        with pytest.raises(ValueError, match="ISO3166-1-Alpha-2"):
+            transform_geojson_task.fn(geojson_file, LEVEL_CONFIGS["Country"])
+
+    def test_empty_collection_keeps_schema(self, tmp_path):
+        geojson_file = _write_geojson(tmp_path / "countries.geojson", [])
+
+        df = transform_geojson_task.fn(geojson_file, LEVEL_CONFIGS["Country"])
+
+        assert df.is_empty()
+        assert df.columns == ["Name", "Code", "Geometry", "ParentCode"]
+        assert set(df.dtypes) == {pl.Utf8}
+
+    def test_rejects_other_geojson_types(self, tmp_path):
+        geojson_file = _write_geojson(
+            tmp_path / "countries.geojson", [], collection_type="Feature"
+        )
+
+        with pytest.raises(ValueError, match="Expected FeatureCollection"):
+            transform_geojson_task.fn(geojson_file, LEVEL_CONFIGS["Country"])
+
+
+# One feature per country, European or not, with every property of every level
+COUNTRY_FEATURES = [
+    _feature(
+        {
+            "name": f"{country} name",
+            "ISO3166-1-Alpha-2": country,
+            "region_code": f"{country}-R",
+            "COMM_NAME": f"{country} municipality",
+            "COMM_ID": f"{country}001",
+            "CNTR_CODE": country,
+        }
+    )
+    for country in ["FR", "US", "DE", "CN", "GB", None]
+]
+
+
+@pytest.mark.usefixtures("prefect_harness")
+class TestImportGeojsonFlow:
+
+    @pytest.mark.parametrize("level", list(LEVEL_CONFIGS))
+    def test_country_filter_matches_filtering_after_transform(self, tmp_path, level):
+        """Skipping features in the loop writes what filtering the frame did."""
+        level_config = LEVEL_CONFIGS[level]
+        source_dir = tmp_path / "raw"
+        source_dir.mkdir()
+        geojson_file = _write_geojson(
+            source_dir / f"europe_{level_config.file_suffix}.geojson",
+            COUNTRY_FEATURES,
+        )
+
+        import_geojson_flow(level=level, source_dir=source_dir, dest_dir=tmp_path)
+
+        # Former behaviour: transform everything, then filter on the country code
+        expected = transform_geojson_task.fn(geojson_file, level_config)
+        if level == "Country":
+            expected = expected.filter(pl.col("Code").is_in(EUROPEAN_COUNTRY_CODES))
+        else:
+            expected = lookup_country_task.fn(expected).filter(
+                pl.col("CountryCode").is_in(EUROPEAN_COUNTRY_CODES)
+            )
+        written = pl.read_ndjson(
+            tmp_path / f"{level}.ndjson", schema=expected.schema
+        )
+        assert written.equals(expected)
+        if level == "Region":
+            # Regions have no parent property, so no country to keep them for
+            assert written.is_empty()
+        else:
+            assert written["Code"].str.slice(0, 2).to_list() == ["FR", "DE", "GB"]